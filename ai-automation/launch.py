@@ -6,18 +6,91 @@ Helps users get started with the AI automation tools
 
 import os
 import sys
-import subprocess
-from pathlib import Path
 
-def print_banner():
-    print("""
+# Normalized distribution names (lowercase, '-' -> '_') the apps depend on
+REQUIRED_PACKAGES = frozenset({
+    'streamlit', 'openai', 'python_dotenv', 'pandas',
+    'python_docx', 'pypdf2', 'email_validator'
+})
+
+# Menu choice -> (script path, display name)
+APPS = {
+    '1': ('resume-optimizer/app.py', 'Resume Optimizer'),
+    '2': ('linkedin-generator/app.py', 'LinkedIn Post Generator'),
+    '3': ('email-responder/app.py', 'Email Responder')
+}
+
+# Display names for packages whose normalized name differs
+_DIST_NAME = {
+    'python_dotenv': 'python-dotenv',
+    'python_docx': 'python-docx',
+    'pypdf2': 'PyPDF2',
+    'email_validator': 'email-validator',
+}
+
+_BANNER = """
 🤖 ============================================ 🤖
     AI AUTOMATION PORTFOLIO - QUICK LAUNCH
 🤖 ============================================ 🤖
 
 Week 3: AI Integration + Automation Portfolio
 Built for Fiverr services (₹2,000-5,000 per project)
-""")
+"""
+
+_APPS_INFO = """
+🚀 Available Applications:
+
+1. 📄 Resume Optimizer (resume-optimizer/app.py)
+   • AI-powered ATS-compatible resume analysis
+   • Keyword extraction and optimization
+   • Fiverr pricing: ₹2,000-5,000
+
+2. 💼 LinkedIn Post Generator (linkedin-generator/app.py)
+   • Professional content creation with bulk processing
+   • Multiple post types and optimization
+   • Fiverr pricing: ₹2,000-8,000
+
+3. 📧 Email Responder (email-responder/app.py)
+   • Automated professional email responses
+   • Customer service templates
+   • Fiverr pricing: ₹2,500-8,000
+"""
+
+_BUSINESS_INFO = """
+💰 FIVERR BUSINESS OPPORTUNITY:
+
+📊 Revenue Potential (Conservative):
+   • Resume Services: 10 projects × ₹3,000 = ₹30,000/month
+   • LinkedIn Content: 8 packages × ₹4,000 = ₹32,000/month
+   • Email Automation: 5 setups × ₹4,000 = ₹20,000/month
+   • TOTAL: ₹82,000/month (part-time)
+
+🎯 Target Customers:
+   • Small business owners needing professional communication
+   • Job seekers wanting optimized resumes
+   • Marketing professionals requiring content
+   • HR departments seeking efficiency
+
+📈 Growth Strategy:
+   1. Launch 3 core gigs on Fiverr
+   2. Build reviews with quality service delivery
+   3. Add premium packages and upsells
+   4. Scale to ₹100,000+/month within 6 months
+
+📚 Resources:
+   • README.md - Complete project overview
+   • BUSINESS_GUIDE.md - Detailed Fiverr strategy
+   • PROJECT_SUMMARY.md - Technical specifications
+
+🚀 Next Steps:
+   1. Test all applications locally
+   2. Create Fiverr seller account
+   3. Launch your first gig
+   4. Start your AI automation empire!
+"""
+
+def print_banner():
+    print(_BANNER)
 
 def check_python():
     """Check Python installation"""
@@ -33,51 +106,86 @@ def check_python():
 def check_requirements():
     """Check if requirements are installed"""
     print("\n📦 Checking required packages...")
-    required_packages = [
-        'streamlit', 'openai', 'python-dotenv', 'pandas', 
-        'python-docx', 'PyPDF2', 'email-validator'
-    ]
     
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-            print(f"✅ {package}")
-        except ImportError:
-            print(f"❌ {package} - Missing")
-            missing_packages.append(package)
+    # One scan of installed distributions instead of probing each package
+    from importlib.metadata import distributions
+    installed = {
+        dist.metadata['Name'].lower().replace('-', '_')
+        for dist in distributions()
+        if dist.metadata['Name']
+    }
+    missing = REQUIRED_PACKAGES - installed
+    
+    for package in sorted(REQUIRED_PACKAGES):
+        name = _DIST_NAME.get(package, package)
+        if package in missing:
+            print(f"❌ {name} - Missing")
+        else:
+            print(f"✅ {name}")
     
-    return missing_packages
+    return sorted((_DIST_NAME.get(package, package) for package in missing), key=str.lower)
 
 def install_requirements():
     """Install missing requirements"""
+    import importlib.util
+    
     print("\n📥 Installing requirements...")
-    try:
-        subprocess.check_call([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'])
+    pip_args = ['install', '-q', '--disable-pip-version-check', '--no-input',
+                '-r', 'requirements.txt']
+    
+    if importlib.util.find_spec('pip') is not None:
+        # Run pip in this interpreter instead of starting a new one
+        import runpy
+        saved_argv = sys.argv
+        sys.argv = ['pip'] + pip_args
+        try:
+            runpy.run_module('pip', run_name='__main__', alter_sys=True)
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = e.code or 0
+        finally:
+            sys.argv = saved_argv
+    else:
+        import subprocess
+        exit_code = subprocess.call([sys.executable, '-m', 'pip'] + pip_args)
+    
+    if exit_code == 0:
         print("✅ All packages installed successfully!")
         return True
-    except subprocess.CalledProcessError:
+    else:
         print("❌ Failed to install packages. Please run manually:")
         print("pip install -r requirements.txt")
         return False
 
-def check_env_file():
-    """Check for environment file"""
+# The value the README's .env example ships with, which isn't a real key
+_PLACEHOLDER_KEY = 'your_openai_api_key_here'
+
+def _is_real_key(value):
+    """Whether an OPENAI_API_KEY value is set to something other than the placeholder"""
+    value = value.strip().strip('"\'')
+    return bool(value) and value != _PLACEHOLDER_KEY
+
+def resolve_api_key():
+    """Check environment configuration and return whether an API key is available"""
     print("\n🔧 Checking environment configuration...")
     
-    env_file = Path('.env')
-    env_template = Path('.env.template')
+    has_key = _is_real_key(os.environ.get('OPENAI_API_KEY', ''))
     
-    if env_file.exists():
+    if os.path.exists('.env'):
         print("✅ .env file found")
-        return True
-    elif env_template.exists():
+        if not has_key:
+            with open('.env') as f:
+                has_key = any(
+                    line.startswith('OPENAI_API_KEY=') and _is_real_key(line.partition('=')[2])
+                    for line in f
+                )
+    elif os.path.exists('.env.template'):
         print("⚠️  .env file not found, but .env.template exists")
         print("📝 Please copy .env.template to .env and add your OpenAI API key")
-        return False
     else:
         print("❌ No environment configuration found")
-        return False
+    
+    return has_key
 
 def get_openai_key():
     """Get OpenAI API key from user"""
@@ -89,9 +197,12 @@ def get_openai_key():
     api_key = input("Enter your OpenAI API key (or press Enter to skip): ").strip()
     
     if api_key:
-        # Save to .env file
-        with open('.env', 'w') as f:
-            f.write(f"OPENAI_API_KEY={api_key}\n")
+        # Save to .env file, readable only by the current user
+        fd = os.open('.env', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, f"OPENAI_API_KEY={api_key}\n".encode())
+        finally:
+            os.close(fd)
         print("✅ API key saved to .env file")
         return True
     else:
@@ -100,102 +211,67 @@ def get_openai_key():
 
 def show_applications():
     """Display available applications"""
-    print("""
-🚀 Available Applications:
-
-1. 📄 Resume Optimizer (resume-optimizer/app.py)
-   • AI-powered ATS-compatible resume analysis
-   • Keyword extraction and optimization
-   • Fiverr pricing: ₹2,000-5,000
+    print(_APPS_INFO)
 
-2. 💼 LinkedIn Post Generator (linkedin-generator/app.py)
-   • Professional content creation with bulk processing
-   • Multiple post types and optimization
-   • Fiverr pricing: ₹2,000-8,000
-
-3. 📧 Email Responder (email-responder/app.py)
-   • Automated professional email responses
-   • Customer service templates
-   • Fiverr pricing: ₹2,500-8,000
-""")
+def _preload_streamlit():
+    """Import streamlit in the background so its files are warm in the OS cache"""
+    try:
+        import streamlit  # noqa: F401
+    except ImportError:
+        pass
 
 def launch_application():
     """Launch selected application"""
-    print("\nWhich application would you like to launch?")
-    print("1. Resume Optimizer")
-    print("2. LinkedIn Post Generator") 
-    print("3. Email Responder")
-    print("4. All applications info")
-    print("5. Exit")
-    
-    choice = input("\nEnter your choice (1-5): ").strip()
-    
-    apps = {
-        '1': ('resume-optimizer/app.py', 'Resume Optimizer'),
-        '2': ('linkedin-generator/app.py', 'LinkedIn Post Generator'),
-        '3': ('email-responder/app.py', 'Email Responder')
-    }
+    import shutil
     
-    if choice in apps:
-        app_path, app_name = apps[choice]
-        print(f"\n🚀 Launching {app_name}...")
-        print(f"Command: streamlit run {app_path}")
-        print("\n📝 Note: The app will open in your browser automatically.")
-        print("🔧 Add your OpenAI API key in the sidebar to activate AI features.")
-        print("❌ Press Ctrl+C to stop the application.\n")
+    while True:
+        print("\nWhich application would you like to launch?")
+        print("1. Resume Optimizer")
+        print("2. LinkedIn Post Generator") 
+        print("3. Email Responder")
+        print("4. All applications info")
+        print("5. Exit")
         
-        try:
-            subprocess.run(['streamlit', 'run', app_path])
-        except KeyboardInterrupt:
-            print("\n👋 Application stopped. Thanks for using AI Automation Portfolio!")
-        except FileNotFoundError:
-            print("❌ Streamlit not found. Please install requirements first.")
-    
-    elif choice == '4':
-        show_business_info()
-    elif choice == '5':
-        print("👋 Goodbye! Good luck with your AI automation business!")
-    else:
-        print("❌ Invalid choice. Please try again.")
-        launch_application()
+        choice = input("\nEnter your choice (1-5): ").strip()
+        
+        if choice in APPS:
+            app_path, app_name = APPS[choice]
+            if shutil.which('streamlit') is None:
+                print("❌ Streamlit not found. Please install requirements first.")
+                return
+            
+            print(f"\n🚀 Launching {app_name}...")
+            print(f"Command: streamlit run {app_path}")
+            print("\n📝 Note: The app will open in your browser automatically.")
+            print("🔧 Add your OpenAI API key in the sidebar to activate AI features.")
+            print("❌ Press Ctrl+C to stop the application.\n")
+            
+            if os.name != 'nt':
+                # Hand the process over to streamlit instead of waiting on a child
+                sys.stdout.flush()
+                os.execvp('streamlit', ['streamlit', 'run', app_path])
+            
+            # execvp doesn't replace the process on Windows, so run it as a child
+            import subprocess
+            try:
+                subprocess.run(['streamlit', 'run', app_path])
+            except KeyboardInterrupt:
+                print("\n👋 Application stopped. Thanks for using AI Automation Portfolio!")
+            return
+        
+        elif choice == '4':
+            show_business_info()
+        elif choice == '5':
+            print("👋 Goodbye! Good luck with your AI automation business!")
+            return
+        else:
+            print("❌ Invalid choice. Please try again.")
 
 def show_business_info():
     """Show business and revenue information"""
-    print("""
-💰 FIVERR BUSINESS OPPORTUNITY:
-
-📊 Revenue Potential (Conservative):
-   • Resume Services: 10 projects × ₹3,000 = ₹30,000/month
-   • LinkedIn Content: 8 packages × ₹4,000 = ₹32,000/month
-   • Email Automation: 5 setups × ₹4,000 = ₹20,000/month
-   • TOTAL: ₹82,000/month (part-time)
-
-🎯 Target Customers:
-   • Small business owners needing professional communication
-   • Job seekers wanting optimized resumes
-   • Marketing professionals requiring content
-   • HR departments seeking efficiency
-
-📈 Growth Strategy:
-   1. Launch 3 core gigs on Fiverr
-   2. Build reviews with quality service delivery
-   3. Add premium packages and upsells
-   4. Scale to ₹100,000+/month within 6 months
-
-📚 Resources:
-   • README.md - Complete project overview
-   • BUSINESS_GUIDE.md - Detailed Fiverr strategy
-   • PROJECT_SUMMARY.md - Technical specifications
-
-🚀 Next Steps:
-   1. Test all applications locally
-   2. Create Fiverr seller account
-   3. Launch your first gig
-   4. Start your AI automation empire!
-""")
+    print(_BUSINESS_INFO)
     
     input("\nPress Enter to continue...")
-    launch_application()
 
 def main():
     """Main application launcher"""
@@ -218,16 +294,20 @@ def main():
             print("❌ Cannot continue without required packages.")
             return
     
-    # Check environment file
-    check_env_file()
+    # Check environment file and API key in one pass
+    has_key = resolve_api_key()
     
     # Setup API key if needed
-    if not os.getenv('OPENAI_API_KEY'):
+    if not has_key:
         get_openai_key()
     
     # Show applications
     show_applications()
     
+    # Warm streamlit's imports while the user reads the menu
+    import threading
+    threading.Thread(target=_preload_streamlit, daemon=True).start()
+    
     # Launch application
     launch_application()
 
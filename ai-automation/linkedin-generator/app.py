@@ -4,146 +4,531 @@ Creates engaging, professional LinkedIn content using OpenAI GPT
 """
 
 import streamlit as st
+import hashlib
+import re
 import sys
-import os
+from collections import Counter, OrderedDict, deque
+from itertools import islice
 from pathlib import Path
-import pandas as pd
 from datetime import datetime
 import json
 
-# Add parent directory to path to import shared utilities
-parent_dir = Path(__file__).parent.parent
-sys.path.append(str(parent_dir))
+# Add parent directory to path to import shared utilities; Streamlit re-runs
+# this script on every interaction, so only add it once. The shared utilities
+# themselves are imported where they're first needed.
+parent_dir = str(Path(__file__).parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
-from shared_utils.openai_utils import OpenAIClient, LINKEDIN_GENERATION_PROMPTS
+# Each tab runs as a fragment so interacting with one tab only reruns that
+# tab; st.fragment needs Streamlit 1.37+ (as pinned), older versions rerun
+# the whole page
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+# Bulk generation sends up to this many topics of the same type in one request
+_BULK_BATCH_SIZE = 10
+
+_BULK_POST_STYLES = {
+    "Professional Insights": "share valuable professional insights, opening with a compelling hook and closing with a call-to-action",
+    "Tips & Advice": "share 3-5 practical, actionable tips, opening with a problem or opportunity and closing with a call-to-action",
+    "Question/Discussion": "open with a compelling observation and ask 1-2 thought-provoking questions that invite professional discussion",
+    "Success Story": "tell a short success story covering the challenge, actions taken, results achieved and lessons learned"
+}
+
+_BULK_PROMPT = """
+Write one LinkedIn post for each of the numbered topics below.
+
+Each post should {post_style}.
+Tone: {tone}
+Length: {length}
+Keep every post conversational yet professional and end it with relevant hashtags.
+
+Return a JSON object of the form {{"posts": [{{"index": 1, "post": "..."}}, ...]}}
+with exactly one entry per topic, using the topic's number as its index.
+
+Topics:
+{topics}
+"""
+
+# Near-duplicate cache: inputs that only differ in case, punctuation, word order
+# or these filler words reuse an earlier post from the same session
+_SIMILAR_CACHE_SIZE = 500
+_FILLER_WORDS = frozenset({
+    "a", "an", "the", "in", "on", "of", "for", "to", "and", "with", "about", "at", "by"
+})
+
+def _similarity_key(*parts):
+    """Canonical form of free-text inputs used to match near-identical requests"""
+    canonical = []
+    for part in parts:
+        words = re.findall(r"[a-z0-9#+]+", part.lower())
+        canonical.append(" ".join(sorted({word for word in words if word not in _FILLER_WORDS})))
+    return tuple(canonical)
+
+def _similar_posts():
+    """Session-scoped LRU of canonical request -> generated post"""
+    if 'similar_posts' not in st.session_state:
+        st.session_state.similar_posts = OrderedDict()
+    return st.session_state.similar_posts
+
+# Engagement post prompts keep their fixed instructions first and the user's
+# topic last, so repeated requests share a byte-identical prompt prefix
+_ENGAGEMENT_TEMPLATES = {
+    "Question": """
+Create a LinkedIn post that asks a thought-provoking question about the topic below.
+Make it engaging and encourage professional discussions.
+
+The post should:
+- Start with a compelling statement or observation
+- Ask 1-2 specific questions
+- Include relevant hashtags
+- Be conversational yet professional
+
+---
+Topic: {topic}
+{angle_block}
+""",
+    
+    "Tips/Advice": """
+Create a LinkedIn post sharing practical tips or advice about the topic below.
+
+Format as:
+- Hook with a problem or opportunity
+- 3-5 actionable tips
+- Conclusion with a call-to-action
+- Relevant hashtags
+
+---
+Topic: {topic}
+{angle_block}
+""",
+    
+    "Success Story": """
+Create a LinkedIn post about a success story related to the topic below.
+
+Structure:
+- Brief background/challenge
+- Actions taken
+- Results achieved
+- Lessons learned
+- Inspirational closing
+- Relevant hashtags
+
+---
+Topic: {topic}
+{angle_block}
+""",
+    
+    "Industry News": """
+Create a LinkedIn post commenting on industry news or trends about the topic below.
+
+Include:
+- Brief news summary
+- Your professional opinion
+- Implications for the industry
+- Questions for engagement
+- Relevant hashtags
+
+---
+Topic: {topic}
+{angle_block}
+"""
+}
+
+_ENGAGEMENT_ANGLE_LABELS = {
+    "Success Story": "Personal context",
+    "Industry News": "Personal perspective"
+}
+
+# Create Post tab choices that map onto an engagement template
+_ENGAGEMENT_POST_TYPES = {
+    "Tips & Advice": "Tips/Advice",
+    "Question/Discussion": "Question",
+    "Success Story": "Success Story",
+    "Industry News": "Industry News"
+}
+
+_OPTIMIZATION_GOALS = {
+    "More Engagement": "Rewrite to increase likes, comments, and shares",
+    "Professional Tone": "Make more professional and business-appropriate",
+    "Casual Tone": "Make more conversational and relatable",
+    "Add Hashtags": "Add relevant and trending hashtags",
+    "Shorten": "Make more concise while keeping key message",
+    "Expand": "Add more detail and context"
+}
+
+_OPTIMIZE_PROMPT = """
+Optimize the LinkedIn post below for the given goal.
+Please provide an improved version that maintains the core message while achieving the optimization goal.
+
+---
+Optimization goal: {goal}
+
+Original Post:
+{original_post}
+"""
+
+# Static Ideas tab content
+_CONTENT_IDEAS = {
+    "Monday": "Motivation Monday - Inspirational quotes/stories",
+    "Tuesday": "Tips Tuesday - Industry tips and advice", 
+    "Wednesday": "Wisdom Wednesday - Lessons learned",
+    "Thursday": "Thought Thursday - Industry insights",
+    "Friday": "Feature Friday - Highlight achievements",
+    "Weekend": "Personal posts - Behind the scenes"
+}
+
+_BEST_PRACTICES = (
+    "Post consistently (3-5 times per week)",
+    "Use native video when possible",
+    "Engage with comments within 1-2 hours",
+    "Keep posts between 150-300 characters",
+    "Use 3-5 relevant hashtags",
+    "Include a clear call-to-action",
+    "Share personal experiences and insights",
+    "Post during peak engagement hours"
+)
+
+@st.cache_data(show_spinner=False)
+def _engagement_df():
+    """Engagement benchmarks table for the Ideas tab"""
+    import pandas as pd
+    
+    return pd.DataFrame({
+        'Post Type': ['Tips & Lists', 'Questions', 'Behind-the-Scenes', 'Industry News', 'Personal Stories'],
+        'Avg. Engagement': ['8.5%', '7.2%', '6.8%', '5.9%', '8.1%'],
+        'Best Time': ['9-10 AM', '12-1 PM', '5-6 PM', '8-9 AM', '7-8 PM']
+    })
+
+@st.cache_data(show_spinner=False)
+def _trending_hashtags_markdown():
+    """Trending hashtags rendered as inline code for the Ideas tab"""
+    trending_hashtags = [
+        "#AI", "#RemoteWork", "#Leadership", "#Innovation", "#DigitalTransformation",
+        "#Sustainability", "#DataScience", "#Entrepreneurship", "#PersonalBranding", "#FutureOfWork"
+    ]
+    return " ".join([f"`{tag}`" for tag in trending_hashtags])
+
+def _key_hash(api_key):
+    """Fingerprint an API key so it can key a cache without being stored in it"""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+@st.cache_resource(show_spinner=False)
+def get_openai_client(api_key_hash, _api_key):
+    """One OpenAI client (and connection pool) per API key, shared across reruns"""
+    from shared_utils.openai_utils import OpenAIClient
+    
+    return OpenAIClient(api_key=_api_key)
+
+@st.cache_data(ttl=3600, max_entries=500, show_spinner=False)
+def _cached_completion(_openai_client, prompt, max_tokens, temperature):
+    """Completion cached on (prompt, max_tokens, temperature) for an hour"""
+    return _openai_client.generate_completion(prompt, max_tokens=max_tokens, temperature=temperature,
+                                              use_cache=True)
 
 class LinkedInGenerator:
     def __init__(self):
         """Initialize the LinkedIn Generator"""
         self.openai_client = None
         
-    def initialize_openai(self):
+    def initialize_openai(self, api_key):
         """Initialize OpenAI client"""
         try:
-            self.openai_client = OpenAIClient()
+            self.openai_client = get_openai_client(_key_hash(api_key), api_key)
             return True, "OpenAI client initialized successfully!"
         except Exception as e:
             return False, f"Failed to initialize OpenAI client: {str(e)}"
     
-    def generate_professional_post(self, topic, target_audience, tone, length, context=""):
-        """Generate a professional LinkedIn post"""
-        if not self.openai_client:
-            raise Exception("OpenAI client not initialized")
+    def _complete(self, prompt, max_tokens, temperature, similar_key=None):
+        """Run a completion, reusing the response for identical requests
+        
+        similar_key, when given, also matches near-identical requests made
+        earlier in the session (see _similarity_key).
+        """
+        if temperature > 0.9:
+            # High-temperature sampling is meant to vary, so don't cache it
+            return self.openai_client.generate_completion(prompt, max_tokens=max_tokens, temperature=temperature)
+        
+        similar = _similar_posts() if similar_key is not None else None
+        if similar is not None and similar_key in similar:
+            similar.move_to_end(similar_key)
+            return similar[similar_key]
+        
+        result = _cached_completion(self.openai_client, prompt, max_tokens, temperature)
+        
+        if similar is not None:
+            similar[similar_key] = result
+            if len(similar) > _SIMILAR_CACHE_SIZE:
+                similar.popitem(last=False)
+        return result
+    
+    def _complete_stream(self, prompt, max_tokens, temperature, similar_key=None):
+        """Streaming version of _complete, yielding the post as it is written
+        
+        A near-identical earlier request (or a response cached on disk) is
+        yielded in one piece instead.
+        """
+        cacheable = temperature <= 0.9
+        similar = _similar_posts() if similar_key is not None and cacheable else None
+        if similar is not None and similar_key in similar:
+            similar.move_to_end(similar_key)
+            yield similar[similar_key]
+            return
+        
+        parts = []
+        for part in self.openai_client.generate_completion_stream(
+                prompt, max_tokens=max_tokens, temperature=temperature, use_cache=cacheable):
+            parts.append(part)
+            yield part
+        
+        if similar is not None:
+            similar[similar_key] = "".join(parts).strip()
+            if len(similar) > _SIMILAR_CACHE_SIZE:
+                similar.popitem(last=False)
+    
+    def _professional_prompt(self, topic, target_audience, tone, length, context=""):
+        """Build the prompt for a professional LinkedIn post"""
+        from shared_utils.openai_utils import LINKEDIN_GENERATION_PROMPTS
         
-        prompt = LINKEDIN_GENERATION_PROMPTS["professional_post"].format(
+        return LINKEDIN_GENERATION_PROMPTS["professional_post"].format(
             topic=topic,
             target_audience=target_audience,
             tone=tone,
             length=length,
             context=context
         )
+    
+    def generate_professional_post(self, topic, target_audience, tone, length, context=""):
+        """Generate a professional LinkedIn post"""
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
         
-        return self.openai_client.generate_completion(prompt, max_tokens=800, temperature=0.8)
+        prompt = self._professional_prompt(topic, target_audience, tone, length, context)
+        similar_key = ("professional", target_audience, tone, length) + _similarity_key(topic, context)
+        return self._complete(prompt, max_tokens=800, temperature=0.8, similar_key=similar_key)
+    
+    def generate_professional_post_stream(self, topic, target_audience, tone, length, context=""):
+        """Streaming version of generate_professional_post, for st.write_stream"""
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
+        
+        prompt = self._professional_prompt(topic, target_audience, tone, length, context)
+        similar_key = ("professional", target_audience, tone, length) + _similarity_key(topic, context)
+        return self._complete_stream(prompt, max_tokens=800, temperature=0.8, similar_key=similar_key)
     
     def generate_industry_insights(self, industry_topic, key_points):
         """Generate industry insights post"""
         if not self.openai_client:
             raise Exception("OpenAI client not initialized")
         
+        from shared_utils.openai_utils import LINKEDIN_GENERATION_PROMPTS
+        
         prompt = LINKEDIN_GENERATION_PROMPTS["industry_insights"].format(
             industry_topic=industry_topic,
             key_points=key_points
         )
         
-        return self.openai_client.generate_completion(prompt, max_tokens=800, temperature=0.8)
+        similar_key = ("industry_insights",) + _similarity_key(industry_topic, key_points)
+        return self._complete(prompt, max_tokens=800, temperature=0.8, similar_key=similar_key)
+    
+    def _engagement_prompt(self, post_type, topic, personal_angle=""):
+        """Build the prompt for an engagement-focused post"""
+        template = _ENGAGEMENT_TEMPLATES.get(post_type, _ENGAGEMENT_TEMPLATES["Tips/Advice"])
+        label = _ENGAGEMENT_ANGLE_LABELS.get(post_type, "Personal angle")
+        angle_block = f"{label}: {personal_angle}" if personal_angle else ""
+        return template.format(topic=topic, angle_block=angle_block)
     
     def generate_engagement_post(self, post_type, topic, personal_angle=""):
         """Generate engagement-focused posts"""
         if not self.openai_client:
             raise Exception("OpenAI client not initialized")
         
-        prompts = {
-            "Question": f"""
-            Create a LinkedIn post that asks a thought-provoking question about {topic}.
-            Make it engaging and encourage professional discussions.
-            {f"Personal angle: {personal_angle}" if personal_angle else ""}
-            
-            The post should:
-            - Start with a compelling statement or observation
-            - Ask 1-2 specific questions
-            - Include relevant hashtags
-            - Be conversational yet professional
-            """,
-            
-            "Tips/Advice": f"""
-            Create a LinkedIn post sharing practical tips or advice about {topic}.
-            {f"Personal angle: {personal_angle}" if personal_angle else ""}
-            
-            Format as:
-            - Hook with a problem or opportunity
-            - 3-5 actionable tips
-            - Conclusion with a call-to-action
-            - Relevant hashtags
-            """,
-            
-            "Success Story": f"""
-            Create a LinkedIn post about a success story related to {topic}.
-            {f"Personal context: {personal_angle}" if personal_angle else ""}
-            
-            Structure:
-            - Brief background/challenge
-            - Actions taken
-            - Results achieved
-            - Lessons learned
-            - Inspirational closing
-            - Relevant hashtags
-            """,
-            
-            "Industry News": f"""
-            Create a LinkedIn post commenting on industry news or trends about {topic}.
-            {f"Personal perspective: {personal_angle}" if personal_angle else ""}
-            
-            Include:
-            - Brief news summary
-            - Your professional opinion
-            - Implications for the industry
-            - Questions for engagement
-            - Relevant hashtags
-            """
-        }
-        
-        prompt = prompts.get(post_type, prompts["Tips/Advice"])
-        return self.openai_client.generate_completion(prompt, max_tokens=600, temperature=0.7)
+        prompt = self._engagement_prompt(post_type, topic, personal_angle)
+        similar_key = ("engagement", post_type) + _similarity_key(topic, personal_angle)
+        return self._complete(prompt, max_tokens=600, temperature=0.7, similar_key=similar_key)
     
-    def optimize_post(self, original_post, optimization_goal):
-        """Optimize existing LinkedIn post"""
+    def generate_engagement_post_stream(self, post_type, topic, personal_angle=""):
+        """Streaming version of generate_engagement_post, for st.write_stream"""
         if not self.openai_client:
             raise Exception("OpenAI client not initialized")
         
-        goals = {
-            "More Engagement": "Rewrite to increase likes, comments, and shares",
-            "Professional Tone": "Make more professional and business-appropriate",
-            "Casual Tone": "Make more conversational and relatable",
-            "Add Hashtags": "Add relevant and trending hashtags",
-            "Shorten": "Make more concise while keeping key message",
-            "Expand": "Add more detail and context"
+        prompt = self._engagement_prompt(post_type, topic, personal_angle)
+        similar_key = ("engagement", post_type) + _similarity_key(topic, personal_angle)
+        return self._complete_stream(prompt, max_tokens=600, temperature=0.7, similar_key=similar_key)
+    
+    def _bulk_prompt(self, topics, post_type, tone, length):
+        """Build the prompt asking for one post per topic as JSON"""
+        return _BULK_PROMPT.format(
+            post_style=_BULK_POST_STYLES.get(post_type, _BULK_POST_STYLES["Tips & Advice"]),
+            tone=tone,
+            length=length,
+            topics="\n".join(f"{i}. {topic}" for i, topic in enumerate(topics, 1))
+        )
+    
+    def _parse_bulk_posts(self, responses, topics):
+        """Split JSON bulk responses into one list of posts per topic"""
+        posts = [[] for _ in topics]
+        for response in responses:
+            for entry in json.loads(response).get("posts", []):
+                index = entry.get("index")
+                if isinstance(index, int) and 1 <= index <= len(topics) and entry.get("post"):
+                    posts[index - 1].append(entry["post"].strip())
+        return posts
+    
+    def _bulk_request(self, post_type, topics, n, tone, length):
+        """The request for one bulk job: several topics of one post type, n posts each"""
+        return {
+            "prompt": self._bulk_prompt(topics, post_type, tone, length),
+            "max_tokens": min(400 * len(topics), 4000),
+            "n": n,
+            "response_format": {"type": "json_object"}
         }
+    
+    def _job_posts(self, responses, topics, n):
+        """Posts per topic from one bulk job's response(s), or the error it hit"""
+        if isinstance(responses, Exception):
+            return responses
+        try:
+            return self._parse_bulk_posts([responses] if n == 1 else responses, topics)
+        except ValueError as e:
+            return e
+    
+    def generate_posts_bulk(self, jobs, tone, length):
+        """Run bulk jobs concurrently, with at most 10 requests in flight
         
-        prompt = f"""
-        Optimize the following LinkedIn post to {goals.get(optimization_goal, optimization_goal)}:
+        jobs is a list of (post_type, topics, n) as built by _plan_bulk_jobs.
+        Returns one entry per job holding a list per topic of up to n posts,
+        or an Exception in place of a job that failed. Rate limits and
+        transient errors are retried (see OpenAIClient.agenerate_many).
+        """
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
         
-        Original Post:
-        {original_post}
+        requests = [self._bulk_request(post_type, topics, n, tone, length) for post_type, topics, n in jobs]
+        responses = self.openai_client.generate_many(requests, max_concurrency=10, temperature=0.7,
+                                                      use_cache=True)
+        return [self._job_posts(r, topics, n) for r, (_, topics, n) in zip(responses, jobs)]
+    
+    def submit_posts_batch(self, jobs, tone, length):
+        """Queue bulk jobs on the OpenAI Batch API, returning the batch id
+        
+        jobs is a list of (post_type, topics, n) as built by _plan_bulk_jobs.
+        """
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
+        
+        requests = [
+            dict(self._bulk_request(post_type, topics, n, tone, length), custom_id=str(i))
+            for i, (post_type, topics, n) in enumerate(jobs)
+        ]
+        return self.openai_client.submit_batch(requests, temperature=0.7)
+    
+    def fetch_posts_batch(self, batch_id, jobs):
+        """Posts from a finished (or expired) batch, or None while it is still running
         
-        Please provide an improved version that maintains the core message while achieving the optimization goal.
+        Returns one entry per job, like the results of generate_posts_bulk,
+        with an Exception in place of any job that failed.
         """
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
         
-        return self.openai_client.generate_completion(prompt, max_tokens=600, temperature=0.6)
+        results = self.openai_client.fetch_batch_results(batch_id)
+        if results is None:
+            return None
+        
+        job_posts = []
+        for i, (post_type, topics, n) in enumerate(jobs):
+            responses = results.get(str(i))
+            if responses is None:
+                responses = Exception("request failed in batch")
+            job_posts.append(self._job_posts(responses, topics, n))
+        return job_posts
+    
+    def _optimize_prompt(self, original_post, optimization_goal):
+        """Build the prompt for optimizing an existing post"""
+        return _OPTIMIZE_PROMPT.format(
+            goal=_OPTIMIZATION_GOALS.get(optimization_goal, optimization_goal),
+            original_post=original_post
+        )
+    
+    def optimize_post(self, original_post, optimization_goal):
+        """Optimize existing LinkedIn post"""
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
+        
+        prompt = self._optimize_prompt(original_post, optimization_goal)
+        return self._complete(prompt, max_tokens=600, temperature=0.6)
+    
+    def optimize_post_stream(self, original_post, optimization_goal):
+        """Streaming version of optimize_post, for st.write_stream"""
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
+        
+        prompt = self._optimize_prompt(original_post, optimization_goal)
+        return self._complete_stream(prompt, max_tokens=600, temperature=0.6)
+
+@st.cache_resource(show_spinner=False)
+def get_generator(api_key_hash, _api_key):
+    """Initialized LinkedInGenerator per API key, shared across reruns and sessions"""
+    generator = LinkedInGenerator()
+    success, message = generator.initialize_openai(_api_key)
+    if not success:
+        # Raising keeps a failed initialization out of the cache
+        raise Exception(message)
+    return generator
+
+def _plan_bulk_jobs(topics_list, post_types, quantity):
+    """Work out the bulk requests to make
+    
+    Returns the list of (topic, post_type) tasks, one per post requested in
+    display order, and the jobs covering them as (post_type, topics, n).
+    Repeated (topic, type) pairs are only requested once, asking for that
+    many posts, and topics needing the same number of posts of a type share
+    one prompt of up to _BULK_BATCH_SIZE topics.
+    """
+    tasks = [
+        (topic, post_types[i % len(post_types)])
+        for topic in topics_list
+        for i in range(quantity)
+    ]
+    
+    groups = {}
+    for (topic, post_type), count in Counter(tasks).items():
+        groups.setdefault((post_type, count), []).append(topic)
+    
+    jobs = []
+    for (post_type, count), group_topics in groups.items():
+        for start in range(0, len(group_topics), _BULK_BATCH_SIZE):
+            jobs.append((post_type, group_topics[start:start + _BULK_BATCH_SIZE], count))
+    return tasks, jobs
+
+def _assemble_bulk_posts(tasks, jobs, job_posts):
+    """Match job results back to tasks, reporting jobs that failed"""
+    generated = {}
+    for (post_type, topics, _), posts_per_topic in zip(jobs, job_posts):
+        if isinstance(posts_per_topic, Exception):
+            st.error(f"Error generating posts for {', '.join(topics)}: {str(posts_per_topic)}")
+            continue
+        
+        for topic, posts in zip(topics, posts_per_topic):
+            generated[(topic, post_type)] = iter(posts)
+    
+    all_posts = []
+    for topic, post_type in tasks:
+        post = next(generated.get((topic, post_type), iter(())), None)
+        if post is not None:
+            all_posts.append({
+                'Topic': topic,
+                'Type': post_type,
+                'Post': post
+            })
+    return all_posts
 
 def save_post_to_history(post_content, post_type, topic):
     """Save generated post to history"""
     if 'post_history' not in st.session_state:
-        st.session_state.post_history = []
+        # Bounded to the last 20 posts, newest first
+        st.session_state.post_history = deque(maxlen=20)
     
     post_data = {
         'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
@@ -152,9 +537,343 @@ def save_post_to_history(post_content, post_type, topic):
         'content': post_content[:100] + "..." if len(post_content) > 100 else post_content
     }
     
-    st.session_state.post_history.insert(0, post_data)
-    # Keep only last 20 posts
-    st.session_state.post_history = st.session_state.post_history[:20]
+    st.session_state.post_history.appendleft(post_data)
+
+@_fragment
+def _create_post_tab(generator):
+    """Create Post tab: write a single post"""
+    st.header("Create New LinkedIn Post")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Post type selection
+        post_type = st.selectbox(
+            "Post Type",
+            ["Professional Insights", "Tips & Advice", "Question/Discussion", "Success Story", "Industry News", "Personal Branding"]
+        )
+        
+        # Topic input
+        topic = st.text_input("Topic/Subject", placeholder="e.g., AI in Healthcare, Remote Work Benefits")
+        
+        # Additional context
+        if post_type in ["Professional Insights", "Industry News"]:
+            context = st.text_area("Key Points or Context", 
+                                 placeholder="Add key points you want to cover...")
+        else:
+            context = st.text_area("Personal Context (Optional)", 
+                                 placeholder="Add personal experience or angle...")
+    
+    with col2:
+        # Post settings
+        st.subheader("Post Settings")
+        
+        target_audience = st.selectbox(
+            "Target Audience",
+            ["Professionals", "Entrepreneurs", "Students", "Industry Experts", "Job Seekers", "General Business"]
+        )
+        
+        tone = st.selectbox(
+            "Tone",
+            ["Professional", "Conversational", "Inspirational", "Educational", "Thought Leadership"]
+        )
+        
+        length = st.selectbox(
+            "Post Length",
+            ["Short (50-100 words)", "Medium (100-200 words)", "Long (200+ words)"]
+        )
+        
+        include_hashtags = st.checkbox("Include Hashtags", value=True)
+        include_cta = st.checkbox("Include Call-to-Action", value=True)
+    
+    # Generate button
+    # The latest post lives in session state so it (and its action buttons)
+    # survive the rerun triggered by clicking one of those buttons
+    just_generated = False
+    if st.button("🚀 Generate Post", type="primary", use_container_width=True):
+        if generator is None:
+            st.error("Please configure your OpenAI API key first!")
+        elif not topic:
+            st.error("Please enter a topic!")
+        else:
+            try:
+                if post_type == "Professional Insights":
+                    stream = generator.generate_professional_post_stream(
+                        topic, target_audience, tone.lower(), length.split()[0].lower(), context
+                    )
+                elif post_type in _ENGAGEMENT_POST_TYPES:
+                    stream = generator.generate_engagement_post_stream(
+                        _ENGAGEMENT_POST_TYPES[post_type], topic, context
+                    )
+                else:  # Personal Branding
+                    stream = generator.generate_professional_post_stream(
+                        f"Personal branding around {topic}", target_audience, tone.lower(), 
+                        length.split()[0].lower(), context
+                    )
+                
+                # Display result as it is written
+                st.markdown("---")
+                st.subheader("📝 Generated LinkedIn Post")
+                
+                result = st.write_stream(stream)
+                st.session_state.generated_post = {
+                    'content': result,
+                    'type': post_type,
+                    'topic': topic,
+                    'timestamp': datetime.now().strftime('%Y%m%d_%H%M')
+                }
+                just_generated = True
+            
+            except Exception as e:
+                st.error(f"Error generating post: {str(e)}")
+    
+    generated_post = st.session_state.get('generated_post')
+    if generated_post:
+        if not just_generated:
+            st.markdown("---")
+            st.subheader("📝 Generated LinkedIn Post")
+            st.markdown(generated_post['content'])
+        
+        # Action buttons
+        col_btn1, col_btn2, col_btn3 = st.columns(3)
+        with col_btn1:
+            st.download_button("📥 Download", generated_post['content'],
+                               f"linkedin_post_{generated_post['timestamp']}.txt")
+        with col_btn2:
+            if st.button("💾 Save to History"):
+                save_post_to_history(generated_post['content'], generated_post['type'], generated_post['topic'])
+                # The sidebar's recent posts live outside this fragment, so
+                # rerun the whole app to show the new entry
+                st.session_state.post_saved = True
+                st.rerun(scope="app")
+            if st.session_state.pop('post_saved', False):
+                st.success("Post saved to history!")
+        with col_btn3:
+            if st.button("📋 Copy to Clipboard"):
+                st.code(generated_post['content'])
+                st.info("Copy the text from the box above!")
+
+@_fragment
+def _optimize_tab(generator):
+    """Optimize Post tab: rewrite an existing post for a goal"""
+    st.header("Optimize Existing Post")
+    
+    original_post = st.text_area(
+        "Paste your existing LinkedIn post:",
+        height=200,
+        placeholder="Paste the LinkedIn post you want to optimize..."
+    )
+    
+    col_opt1, col_opt2 = st.columns(2)
+    
+    with col_opt1:
+        optimization_goal = st.selectbox(
+            "Optimization Goal",
+            ["More Engagement", "Professional Tone", "Casual Tone", "Add Hashtags", "Shorten", "Expand"]
+        )
+    
+    with col_opt2:
+        st.markdown("**Optimization Tips:**")
+        tips = {
+            "More Engagement": "Adds questions, calls-to-action, and engaging hooks",
+            "Professional Tone": "Makes content more business-appropriate",
+            "Casual Tone": "Makes content more conversational and relatable",
+            "Add Hashtags": "Includes relevant and trending hashtags",
+            "Shorten": "Makes content more concise",
+            "Expand": "Adds more detail and context"
+        }
+        st.info(tips.get(optimization_goal, ""))
+    
+    just_optimized = False
+    if st.button("✨ Optimize Post", type="primary", use_container_width=True):
+        if generator is None:
+            st.error("Please configure your OpenAI API key first!")
+        elif not original_post:
+            st.error("Please paste a post to optimize!")
+        else:
+            try:
+                # Display comparison, streaming the optimized version in
+                st.markdown("---")
+                col_before, col_after = st.columns(2)
+                
+                with col_before:
+                    st.subheader("📄 Original Post")
+                    st.text_area("Original:", original_post, height=250, disabled=True, key="original")
+                
+                with col_after:
+                    st.subheader("✨ Optimized Post")
+                    optimized_post = st.write_stream(generator.optimize_post_stream(original_post, optimization_goal))
+                
+                st.session_state.optimized_post = {
+                    'original': original_post,
+                    'content': optimized_post,
+                    'timestamp': datetime.now().strftime('%Y%m%d_%H%M')
+                }
+                just_optimized = True
+            
+            except Exception as e:
+                st.error(f"Error optimizing post: {str(e)}")
+    
+    optimized = st.session_state.get('optimized_post')
+    if optimized:
+        if not just_optimized:
+            st.markdown("---")
+            col_before, col_after = st.columns(2)
+            
+            with col_before:
+                st.subheader("📄 Original Post")
+                st.text_area("Original:", optimized['original'], height=250, disabled=True, key="original")
+            
+            with col_after:
+                st.subheader("✨ Optimized Post")
+                st.markdown(optimized['content'])
+        
+        # Download button
+        st.download_button(
+            "📥 Download Optimized Post",
+            optimized['content'],
+            f"optimized_post_{optimized['timestamp']}.txt"
+        )
+
+@_fragment
+def _bulk_tab(generator):
+    """Bulk Generator tab: posts for several topics at once"""
+    st.header("Bulk Post Generator")
+    
+    st.info("Generate multiple posts at once - perfect for content planning!")
+    
+    col_bulk1, col_bulk2 = st.columns(2)
+    
+    with col_bulk1:
+        bulk_topics = st.text_area(
+            "Topics (one per line):",
+            height=150,
+            placeholder="AI in Healthcare\nRemote Work Benefits\nDigital Marketing Trends\nLeadership Tips"
+        )
+        
+        bulk_quantity = st.slider("Posts per topic", 1, 5, 2)
+    
+    with col_bulk2:
+        bulk_post_types = st.multiselect(
+            "Post Types",
+            ["Professional Insights", "Tips & Advice", "Question/Discussion", "Success Story"],
+            default=["Tips & Advice", "Question/Discussion"]
+        )
+        
+        bulk_tone = st.selectbox("Tone for all posts", ["Professional", "Conversational", "Educational"])
+        bulk_length = st.selectbox("Length for all posts", ["Short (50-100 words)", "Medium (100-200 words)"])
+        use_batch_api = st.checkbox("Submit as Batch (50% cheaper, up to 24h)",
+                                    help="Queue the posts on OpenAI's Batch API and collect them later")
+    
+    if st.button("🔄 Generate Bulk Posts", type="primary"):
+        if generator is None:
+            st.error("Please configure your OpenAI API key first!")
+        elif not bulk_topics.strip():
+            st.error("Please enter at least one topic!")
+        elif not bulk_post_types:
+            st.error("Please select at least one post type!")
+        else:
+            # Strip each line once, dropping blanks and repeated topics (first one wins)
+            topics_list = list(dict.fromkeys(
+                topic for topic in (line.strip() for line in bulk_topics.split('\n')) if topic
+            ))
+            
+            tasks, jobs = _plan_bulk_jobs(topics_list, bulk_post_types, bulk_quantity)
+            
+            if use_batch_api:
+                try:
+                    batch_id = generator.submit_posts_batch(jobs, bulk_tone.lower(), bulk_length)
+                    st.session_state.bulk_batch = {'id': batch_id, 'tasks': tasks, 'jobs': jobs}
+                    st.success(f"Submitted batch {batch_id}. Check back with \"Check batch status\" below.")
+                except Exception as e:
+                    st.error(f"Error submitting batch: {str(e)}")
+            else:
+                with st.spinner(f"Generating {len(tasks)} posts..."):
+                    job_posts = generator.generate_posts_bulk(jobs, bulk_tone.lower(), bulk_length)
+                    
+                    st.session_state.bulk_posts = {
+                        'posts': _assemble_bulk_posts(tasks, jobs, job_posts),
+                        'timestamp': datetime.now().strftime('%Y%m%d')
+                    }
+    
+    bulk_batch = st.session_state.get('bulk_batch')
+    if bulk_batch:
+        st.caption(f"Pending batch: {bulk_batch['id']}")
+        if st.button("🔍 Check batch status"):
+            from shared_utils.openai_utils import BatchFailedError
+            
+            if generator is None:
+                st.error("Please configure your OpenAI API key first!")
+            else:
+                try:
+                    job_posts = generator.fetch_posts_batch(bulk_batch['id'], bulk_batch['jobs'])
+                    if job_posts is None:
+                        batch = generator.openai_client.poll_batch(bulk_batch['id'])
+                        progress = ""
+                        if batch.request_counts:
+                            progress = f" ({batch.request_counts.completed}/{batch.request_counts.total} requests done)"
+                        st.info(f"Batch is {batch.status}{progress}")
+                    else:
+                        st.session_state.bulk_posts = {
+                            'posts': _assemble_bulk_posts(bulk_batch['tasks'], bulk_batch['jobs'], job_posts),
+                            'timestamp': datetime.now().strftime('%Y%m%d')
+                        }
+                        del st.session_state.bulk_batch
+                except BatchFailedError as e:
+                    # It will never finish, so stop tracking it
+                    del st.session_state.bulk_batch
+                    st.error(str(e))
+                except Exception as e:
+                    st.error(f"Error checking batch: {str(e)}")
+    
+    bulk_posts = st.session_state.get('bulk_posts')
+    if bulk_posts:
+        all_posts = bulk_posts['posts']
+        
+        # Display results
+        st.markdown("---")
+        st.subheader(f"📚 Generated {len(all_posts)} Posts")
+        
+        for i, post_data in enumerate(all_posts):
+            with st.expander(f"Post {i+1}: {post_data['Topic']} - {post_data['Type']}"):
+                st.text_area(f"Post {i+1}:", post_data['Post'], height=200, key=f"bulk_post_{i}")
+        
+        # Download all posts
+        if all_posts:
+            bulk_content = "\n\n" + "="*50 + "\n\n".join([
+                f"TOPIC: {post['Topic']}\nTYPE: {post['Type']}\n\n{post['Post']}"
+                for post in all_posts
+            ])
+            
+            st.download_button(
+                "📥 Download All Posts",
+                bulk_content,
+                f"bulk_linkedin_posts_{bulk_posts['timestamp']}.txt"
+            )
+
+@_fragment
+def _ideas_tab():
+    """Ideas tab: content ideas and best practices"""
+    st.header("💡 Content Ideas & Best Practices")
+    
+    col_ideas1, col_ideas2 = st.columns(2)
+    
+    with col_ideas1:
+        st.subheader("📊 High-Engagement Post Types")
+        st.dataframe(_engagement_df())
+        
+        st.subheader("🏷️ Trending Hashtags")
+        st.write(_trending_hashtags_markdown())
+    
+    with col_ideas2:
+        st.subheader("📝 Content Calendar Ideas")
+        
+        for day, idea in _CONTENT_IDEAS.items():
+            st.write(f"**{day}:** {idea}")
+        
+        st.subheader("🎯 Best Practices")
+        for practice in _BEST_PRACTICES:
+            st.write(f"✅ {practice}")
 
 def main():
     st.set_page_config(
@@ -169,9 +888,7 @@ def main():
     Perfect for professionals, marketers, and businesses looking to maintain an active LinkedIn presence.
     """)
     
-    # Initialize the generator
-    if 'generator' not in st.session_state:
-        st.session_state.generator = LinkedInGenerator()
+    generator = None
     
     # Sidebar for API configuration and settings
     with st.sidebar:
@@ -182,15 +899,17 @@ def main():
                                help="Enter your OpenAI API key to use AI features")
         
         if api_key:
-            os.environ['OPENAI_API_KEY'] = api_key
             if st.button("Initialize AI"):
-                success, message = st.session_state.generator.initialize_openai()
-                if success:
-                    st.success(message)
+                try:
+                    get_generator(_key_hash(api_key), api_key)
+                    st.success("OpenAI client initialized successfully!")
                     st.session_state.ai_initialized = True
-                else:
-                    st.error(message)
+                except Exception as e:
+                    st.error(str(e))
                     st.session_state.ai_initialized = False
+            
+            if getattr(st.session_state, 'ai_initialized', False):
+                generator = get_generator(_key_hash(api_key), api_key)
         
         # Service information
         st.markdown("---")
@@ -211,7 +930,7 @@ def main():
         st.markdown("---")
         st.header("📝 Recent Posts")
         if hasattr(st.session_state, 'post_history') and st.session_state.post_history:
-            for i, post in enumerate(st.session_state.post_history[:5]):
+            for i, post in enumerate(islice(st.session_state.post_history, 5)):
                 with st.expander(f"{post['type']} - {post['timestamp']}"):
                     st.write(f"**Topic:** {post['topic']}")
                     st.write(post['content'])
@@ -222,290 +941,16 @@ def main():
     tab1, tab2, tab3, tab4 = st.tabs(["✍️ Create Post", "🔄 Optimize Post", "📊 Bulk Generator", "💡 Ideas"])
     
     with tab1:
-        st.header("Create New LinkedIn Post")
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            # Post type selection
-            post_type = st.selectbox(
-                "Post Type",
-                ["Professional Insights", "Tips & Advice", "Question/Discussion", "Success Story", "Industry News", "Personal Branding"]
-            )
-            
-            # Topic input
-            topic = st.text_input("Topic/Subject", placeholder="e.g., AI in Healthcare, Remote Work Benefits")
-            
-            # Additional context
-            if post_type in ["Professional Insights", "Industry News"]:
-                context = st.text_area("Key Points or Context", 
-                                     placeholder="Add key points you want to cover...")
-            else:
-                context = st.text_area("Personal Context (Optional)", 
-                                     placeholder="Add personal experience or angle...")
-        
-        with col2:
-            # Post settings
-            st.subheader("Post Settings")
-            
-            target_audience = st.selectbox(
-                "Target Audience",
-                ["Professionals", "Entrepreneurs", "Students", "Industry Experts", "Job Seekers", "General Business"]
-            )
-            
-            tone = st.selectbox(
-                "Tone",
-                ["Professional", "Conversational", "Inspirational", "Educational", "Thought Leadership"]
-            )
-            
-            length = st.selectbox(
-                "Post Length",
-                ["Short (50-100 words)", "Medium (100-200 words)", "Long (200+ words)"]
-            )
-            
-            include_hashtags = st.checkbox("Include Hashtags", value=True)
-            include_cta = st.checkbox("Include Call-to-Action", value=True)
-        
-        # Generate button
-        if st.button("🚀 Generate Post", type="primary", use_container_width=True):
-            if not getattr(st.session_state, 'ai_initialized', False):
-                st.error("Please configure your OpenAI API key first!")
-            elif not topic:
-                st.error("Please enter a topic!")
-            else:
-                try:
-                    with st.spinner("AI is crafting your LinkedIn post..."):
-                        if post_type == "Professional Insights":
-                            result = st.session_state.generator.generate_professional_post(
-                                topic, target_audience, tone.lower(), length.split()[0].lower(), context
-                            )
-                        elif post_type in ["Tips & Advice", "Question/Discussion", "Success Story", "Industry News"]:
-                            result = st.session_state.generator.generate_engagement_post(
-                                post_type.split()[0] if "/" not in post_type else "Tips/Advice", 
-                                topic, context
-                            )
-                        else:  # Personal Branding
-                            result = st.session_state.generator.generate_professional_post(
-                                f"Personal branding around {topic}", target_audience, tone.lower(), 
-                                length.split()[0].lower(), context
-                            )
-                        
-                        # Display result
-                        st.markdown("---")
-                        st.subheader("📝 Generated LinkedIn Post")
-                        
-                        # Post preview box
-                        st.text_area("Your LinkedIn Post:", result, height=300, key="generated_post")
-                        
-                        # Action buttons
-                        col_btn1, col_btn2, col_btn3 = st.columns(3)
-                        with col_btn1:
-                            st.download_button("📥 Download", result, f"linkedin_post_{datetime.now().strftime('%Y%m%d_%H%M')}.txt")
-                        with col_btn2:
-                            if st.button("💾 Save to History"):
-                                save_post_to_history(result, post_type, topic)
-                                st.success("Post saved to history!")
-                        with col_btn3:
-                            if st.button("📋 Copy to Clipboard"):
-                                st.code(result)
-                                st.info("Copy the text from the box above!")
-                
-                except Exception as e:
-                    st.error(f"Error generating post: {str(e)}")
+        _create_post_tab(generator)
     
     with tab2:
-        st.header("Optimize Existing Post")
-        
-        original_post = st.text_area(
-            "Paste your existing LinkedIn post:",
-            height=200,
-            placeholder="Paste the LinkedIn post you want to optimize..."
-        )
-        
-        col_opt1, col_opt2 = st.columns(2)
-        
-        with col_opt1:
-            optimization_goal = st.selectbox(
-                "Optimization Goal",
-                ["More Engagement", "Professional Tone", "Casual Tone", "Add Hashtags", "Shorten", "Expand"]
-            )
-        
-        with col_opt2:
-            st.markdown("**Optimization Tips:**")
-            tips = {
-                "More Engagement": "Adds questions, calls-to-action, and engaging hooks",
-                "Professional Tone": "Makes content more business-appropriate",
-                "Casual Tone": "Makes content more conversational and relatable",
-                "Add Hashtags": "Includes relevant and trending hashtags",
-                "Shorten": "Makes content more concise",
-                "Expand": "Adds more detail and context"
-            }
-            st.info(tips.get(optimization_goal, ""))
-        
-        if st.button("✨ Optimize Post", type="primary", use_container_width=True):
-            if not getattr(st.session_state, 'ai_initialized', False):
-                st.error("Please configure your OpenAI API key first!")
-            elif not original_post:
-                st.error("Please paste a post to optimize!")
-            else:
-                try:
-                    with st.spinner("AI is optimizing your post..."):
-                        optimized_post = st.session_state.generator.optimize_post(original_post, optimization_goal)
-                        
-                        # Display comparison
-                        st.markdown("---")
-                        col_before, col_after = st.columns(2)
-                        
-                        with col_before:
-                            st.subheader("📄 Original Post")
-                            st.text_area("Original:", original_post, height=250, disabled=True, key="original")
-                        
-                        with col_after:
-                            st.subheader("✨ Optimized Post")
-                            st.text_area("Optimized:", optimized_post, height=250, key="optimized")
-                        
-                        # Download button
-                        st.download_button(
-                            "📥 Download Optimized Post",
-                            optimized_post,
-                            f"optimized_post_{datetime.now().strftime('%Y%m%d_%H%M')}.txt"
-                        )
-                
-                except Exception as e:
-                    st.error(f"Error optimizing post: {str(e)}")
+        _optimize_tab(generator)
     
     with tab3:
-        st.header("Bulk Post Generator")
-        
-        st.info("Generate multiple posts at once - perfect for content planning!")
-        
-        col_bulk1, col_bulk2 = st.columns(2)
-        
-        with col_bulk1:
-            bulk_topics = st.text_area(
-                "Topics (one per line):",
-                height=150,
-                placeholder="AI in Healthcare\nRemote Work Benefits\nDigital Marketing Trends\nLeadership Tips"
-            )
-            
-            bulk_quantity = st.slider("Posts per topic", 1, 5, 2)
-        
-        with col_bulk2:
-            bulk_post_types = st.multiselect(
-                "Post Types",
-                ["Professional Insights", "Tips & Advice", "Question/Discussion", "Success Story"],
-                default=["Tips & Advice", "Question/Discussion"]
-            )
-            
-            bulk_tone = st.selectbox("Tone for all posts", ["Professional", "Conversational", "Educational"])
-            bulk_length = st.selectbox("Length for all posts", ["Short (50-100 words)", "Medium (100-200 words)"])
-        
-        if st.button("🔄 Generate Bulk Posts", type="primary"):
-            if not getattr(st.session_state, 'ai_initialized', False):
-                st.error("Please configure your OpenAI API key first!")
-            elif not bulk_topics.strip():
-                st.error("Please enter at least one topic!")
-            else:
-                topics_list = [topic.strip() for topic in bulk_topics.split('\n') if topic.strip()]
-                
-                with st.spinner(f"Generating {len(topics_list) * bulk_quantity} posts..."):
-                    all_posts = []
-                    
-                    for topic in topics_list:
-                        for i in range(bulk_quantity):
-                            try:
-                                post_type = bulk_post_types[i % len(bulk_post_types)]
-                                
-                                if post_type == "Professional Insights":
-                                    post = st.session_state.generator.generate_professional_post(
-                                        topic, "Professionals", bulk_tone.lower(), 
-                                        bulk_length.split()[0].lower(), ""
-                                    )
-                                else:
-                                    post = st.session_state.generator.generate_engagement_post(
-                                        post_type.split()[0], topic, ""
-                                    )
-                                
-                                all_posts.append({
-                                    'Topic': topic,
-                                    'Type': post_type,
-                                    'Post': post
-                                })
-                                
-                            except Exception as e:
-                                st.error(f"Error generating post for {topic}: {str(e)}")
-                    
-                    # Display results
-                    st.markdown("---")
-                    st.subheader(f"📚 Generated {len(all_posts)} Posts")
-                    
-                    for i, post_data in enumerate(all_posts):
-                        with st.expander(f"Post {i+1}: {post_data['Topic']} - {post_data['Type']}"):
-                            st.text_area(f"Post {i+1}:", post_data['Post'], height=200, key=f"bulk_post_{i}")
-                    
-                    # Download all posts
-                    if all_posts:
-                        bulk_content = "\n\n" + "="*50 + "\n\n".join([
-                            f"TOPIC: {post['Topic']}\nTYPE: {post['Type']}\n\n{post['Post']}"
-                            for post in all_posts
-                        ])
-                        
-                        st.download_button(
-                            "📥 Download All Posts",
-                            bulk_content,
-                            f"bulk_linkedin_posts_{datetime.now().strftime('%Y%m%d')}.txt"
-                        )
+        _bulk_tab(generator)
     
     with tab4:
-        st.header("💡 Content Ideas & Best Practices")
-        
-        col_ideas1, col_ideas2 = st.columns(2)
-        
-        with col_ideas1:
-            st.subheader("📊 High-Engagement Post Types")
-            engagement_data = {
-                'Post Type': ['Tips & Lists', 'Questions', 'Behind-the-Scenes', 'Industry News', 'Personal Stories'],
-                'Avg. Engagement': ['8.5%', '7.2%', '6.8%', '5.9%', '8.1%'],
-                'Best Time': ['9-10 AM', '12-1 PM', '5-6 PM', '8-9 AM', '7-8 PM']
-            }
-            st.dataframe(pd.DataFrame(engagement_data))
-            
-            st.subheader("🏷️ Trending Hashtags")
-            trending_hashtags = [
-                "#AI", "#RemoteWork", "#Leadership", "#Innovation", "#DigitalTransformation",
-                "#Sustainability", "#DataScience", "#Entrepreneurship", "#PersonalBranding", "#FutureOfWork"
-            ]
-            st.write(" ".join([f"`{tag}`" for tag in trending_hashtags]))
-        
-        with col_ideas2:
-            st.subheader("📝 Content Calendar Ideas")
-            
-            content_ideas = {
-                "Monday": "Motivation Monday - Inspirational quotes/stories",
-                "Tuesday": "Tips Tuesday - Industry tips and advice", 
-                "Wednesday": "Wisdom Wednesday - Lessons learned",
-                "Thursday": "Thought Thursday - Industry insights",
-                "Friday": "Feature Friday - Highlight achievements",
-                "Weekend": "Personal posts - Behind the scenes"
-            }
-            
-            for day, idea in content_ideas.items():
-                st.write(f"**{day}:** {idea}")
-            
-            st.subheader("🎯 Best Practices")
-            best_practices = [
-                "Post consistently (3-5 times per week)",
-                "Use native video when possible",
-                "Engage with comments within 1-2 hours",
-                "Keep posts between 150-300 characters",
-                "Use 3-5 relevant hashtags",
-                "Include a clear call-to-action",
-                "Share personal experiences and insights",
-                "Post during peak engagement hours"
-            ]
-            
-            for practice in best_practices:
-                st.write(f"✅ {practice}")
+        _ideas_tab()
     
     # Footer
     st.markdown("---")
@@ -4,101 +4,539 @@ Analyzes and optimizes resumes using OpenAI GPT for better job matching and ATS
 """
 
 import streamlit as st
+import asyncio
+import hashlib
 import sys
-import os
+import threading
 from pathlib import Path
 import PyPDF2
 from docx import Document
+
+# PDFium-backed PDF parsing (optional dependency, much faster than PyPDF2)
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
+# Token counting for trimming long resumes (optional, falls back to characters)
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
 import io
+import csv
+import json
+import zipfile
+import xml.etree.ElementTree as ET
+from contextlib import closing
 
 # Add parent directory to path to import shared utilities
 parent_dir = Path(__file__).parent.parent
 sys.path.append(str(parent_dir))
 
-from shared_utils.openai_utils import OpenAIClient, RESUME_OPTIMIZATION_PROMPTS
+from shared_utils.openai_utils import BatchFailedError, OpenAIClient, RESUME_OPTIMIZATION_PROMPTS
+
+# Bump when prompts change so cached results from older prompts aren't reused
+_PROMPT_VERSION = "v2"
+
+def _request_key(*parts):
+    """Fingerprint of a request's inputs, used to cache its result"""
+    # JSON-encode rather than join on a separator, which resumes may contain
+    return hashlib.sha256(json.dumps(parts + (_PROMPT_VERSION,)).encode()).hexdigest()
+
+@st.cache_data(show_spinner=False, max_entries=512, ttl=7 * 24 * 3600)
+def _cached_completion(request_key, _openai_client, _system_prompt, _prompt, max_tokens):
+    """Completion cached across sessions on request_key (the prompts aren't re-hashed)"""
+    return _openai_client.generate_completion(_prompt, max_tokens=max_tokens, system_prompt=_system_prompt)
+
+# Resume text sent with a request is trimmed to this many tokens
+_RESUME_TOKEN_BUDGET = 3000
+
+# PDF pages stop being read past this many characters, about twice what the
+# token budget lets through (~4 characters per token)
+_MAX_RESUME_CHARS = _RESUME_TOKEN_BUDGET * 8
+
+# WordprocessingML namespace, as it appears in ElementTree tags
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+# Uploads past these limits are rejected before any parser touches them
+MAX_UPLOAD_MB = 10
+MAX_PDF_PAGES = 50
+
+@st.cache_resource(show_spinner=False)
+def _get_encoding():
+    """The gpt-3.5-turbo tokenizer, or None if it can't be loaded"""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+    try:
+        return tiktoken.encoding_for_model("gpt-3.5-turbo")
+    except Exception:
+        # The encoding is downloaded on first use, which can fail offline
+        return None
+
+def _collect_pages(pages):
+    """Join page texts, stopping once there's more than a request will use"""
+    texts = []
+    size = 0
+    for text in pages:
+        texts.append(text)
+        size += len(text)
+        if size > _MAX_RESUME_CHARS:
+            break
+    return "\n".join(texts).strip()
+
+def _check_page_count(page_count):
+    """Refuse PDFs too long to be a resume"""
+    if page_count > MAX_PDF_PAGES:
+        raise ValueError(f"PDF has {page_count} pages; resumes are limited to {MAX_PDF_PAGES}")
+
+def _fit(text, max_tokens):
+    """Trim text to about max_tokens, keeping its head and tail
+    
+    The head (contact details, summary) and the tail (latest experience in
+    most layouts) carry the most signal, so the middle is dropped. Returns ""
+    for blank input.
+    """
+    text = text.strip()
+    if not text:
+        return ""
+    
+    tail_size = max_tokens // 3
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        if len(tokens) <= max_tokens:
+            return text
+        head = encoding.decode(tokens[:max_tokens - tail_size])
+        tail = encoding.decode(tokens[-tail_size:])
+    else:
+        # Roughly 4 characters per token; cut on whitespace to keep words whole
+        if len(text) <= max_tokens * 4:
+            return text
+        head = text[:(max_tokens - tail_size) * 4].rsplit(None, 1)[0]
+        tail = text[-tail_size * 4:].split(None, 1)[-1]
+    return f"{head.rstrip()}\n[...]\n{tail.lstrip()}"
+
+# Bulk keyword extraction packs up to this many job descriptions into a request
+_KEYWORD_BATCH_SIZE = 8
+
+_KEYWORDS_BATCH_TEMPLATE = """
+For each of the {count} job descriptions below (each introduced by ===JD k===), extract the most
+important keywords and phrases that should be included in a resume: technical skills and tools,
+soft skills, industry-specific terms, impactful action verbs, and certifications or qualifications.
+
+Return a JSON object of the form {{"results": [{{"index": 1, "keywords": ["...", "..."]}}, ...]}}
+with exactly one entry per job description, using its number as the index.
+
+{job_descriptions}
+"""
 
 class ResumeOptimizer:
     def __init__(self):
         """Initialize the Resume Optimizer"""
         self.openai_client = None
         
-    def initialize_openai(self):
+    def initialize_openai(self, api_key=None):
         """Initialize OpenAI client"""
         try:
-            self.openai_client = OpenAIClient()
+            self.openai_client = OpenAIClient(api_key)
+            # Open the connection now so the first real request skips DNS and TLS setup
+            threading.Thread(target=self._warm_up, daemon=True).start()
             return True, "OpenAI client initialized successfully!"
         except Exception as e:
             return False, f"Failed to initialize OpenAI client: {str(e)}"
     
+    def _warm_up(self):
+        """Make a cheap request to get the client's connection pool ready"""
+        try:
+            self.openai_client.client.models.list()
+        except Exception:
+            # Only an optimization; real requests report their own errors
+            pass
+    
+    def _complete(self, system_prompt, prompt, max_tokens, *key_parts):
+        """Run a completion, reusing earlier results for the same inputs
+        
+        Results are kept in the session for instant reruns and in a shared
+        st.cache_data cache for other sessions.
+        """
+        request_key = _request_key(*key_parts)
+        session_key = f"cache:{request_key}"
+        if session_key not in st.session_state:
+            st.session_state[session_key] = _cached_completion(
+                request_key, self.openai_client, system_prompt, prompt, max_tokens
+            )
+        return st.session_state[session_key]
+    
+    def _complete_stream(self, system_prompt, prompt, max_tokens, *key_parts):
+        """Streaming version of _complete, for st.write_stream
+        
+        A result already in the session is yielded in one piece; a streamed
+        one is stored there once it has finished.
+        """
+        session_key = f"cache:{_request_key(*key_parts)}"
+        if session_key in st.session_state:
+            yield st.session_state[session_key]
+            return
+        
+        parts = []
+        for part in self.openai_client.generate_completion_stream(
+                prompt, max_tokens=max_tokens, system_prompt=system_prompt):
+            parts.append(part)
+            yield part
+        st.session_state[session_key] = "".join(parts).strip()
+    
+    async def _acomplete(self, system_prompt, prompt, max_tokens, *key_parts):
+        """Async version of _complete, sharing its per-session results"""
+        session_key = f"cache:{_request_key(*key_parts)}"
+        if session_key not in st.session_state:
+            st.session_state[session_key] = await self.openai_client.agenerate_completion(
+                prompt, max_tokens=max_tokens, system_prompt=system_prompt
+            )
+        return st.session_state[session_key]
+    
+    def iter_pdf_pages(self, pdf_file):
+        """Yield the text of a PDF one page at a time, using PDFium"""
+        # PDFium reads the file through callbacks rather than loading it whole.
+        # Pages are read one after another on purpose: PDFium isn't thread-safe,
+        # even across separate documents, so a thread pool would corrupt state.
+        # Each page is closed as soon as its text is out to keep memory flat.
+        pdf = pdfium.PdfDocument(pdf_file)
+        try:
+            _check_page_count(len(pdf))
+            for index in range(len(pdf)):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                yield text
+        finally:
+            pdf.close()
+    
     def extract_text_from_pdf(self, pdf_file):
-        """Extract text from PDF file"""
+        """Extract text from PDF file
+        
+        Long documents are only read as far as _MAX_RESUME_CHARS, since
+        requests never use more than that.
+        """
+        if PDFIUM_AVAILABLE:
+            try:
+                with closing(self.iter_pdf_pages(pdf_file)) as pages:
+                    return _collect_pages(pages)
+            except ValueError:
+                raise
+            except Exception:
+                # Fall back to PyPDF2 for anything PDFium can't read
+                pdf_file.seek(0)
+        
         try:
             pdf_reader = PyPDF2.PdfReader(pdf_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text.strip()
+            _check_page_count(len(pdf_reader.pages))
+            # extract_text() can return None for pages without a text layer
+            return _collect_pages(page.extract_text() or "" for page in pdf_reader.pages)
         except Exception as e:
             raise Exception(f"Error reading PDF: {str(e)}")
     
+    def _extract_text_from_docx_xml(self, docx_file):
+        """Extract paragraph text straight from a DOCX's word/document.xml
+        
+        iterparse streams the XML, so no document model is built and each
+        paragraph is discarded once its text is out.
+        """
+        paragraphs = []
+        runs = []
+        with zipfile.ZipFile(docx_file) as archive, archive.open("word/document.xml") as document:
+            for _, element in ET.iterparse(document):
+                if element.tag == _W + "t":
+                    runs.append(element.text or "")
+                elif element.tag == _W + "tab" and _W + "pos" not in element.attrib:
+                    # Tab stop definitions in w:pPr/w:tabs carry a position;
+                    # only the bare w:tab inside a run is an actual tab
+                    runs.append("\t")
+                elif element.tag in (_W + "br", _W + "cr"):
+                    runs.append("\n")
+                elif element.tag == _W + "p":
+                    paragraphs.append("".join(runs))
+                    runs = []
+                    element.clear()
+        return "\n".join(paragraphs).strip()
+    
     def extract_text_from_docx(self, docx_file):
         """Extract text from DOCX file"""
+        try:
+            return self._extract_text_from_docx_xml(docx_file)
+        except (zipfile.BadZipFile, KeyError, ET.ParseError):
+            # Let python-docx have a go at anything unusual
+            docx_file.seek(0)
+        
         try:
             doc = Document(docx_file)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text.strip()
+            return "\n".join(paragraph.text for paragraph in doc.paragraphs).strip()
         except Exception as e:
             raise Exception(f"Error reading DOCX: {str(e)}")
     
+    def _analyze_prompt(self, resume_content, job_description=""):
+        """Build the full-analysis prompt for one resume"""
+        return RESUME_OPTIMIZATION_PROMPTS["analyze"].format(
+            resume_content=resume_content,
+            job_description=job_description or "No specific job description provided"
+        )
+    
+    def extract_text(self, uploaded_file):
+        """Extract text from an uploaded PDF, DOCX or TXT resume
+        
+        The format is sniffed from the file's first bytes rather than the
+        browser-supplied MIME type, and oversized files are refused before
+        they're parsed.
+        """
+        if uploaded_file.size > MAX_UPLOAD_MB * 1024 * 1024:
+            raise ValueError(f"File is larger than {MAX_UPLOAD_MB} MB")
+        
+        head = uploaded_file.read(8)
+        uploaded_file.seek(0)
+        if head.startswith(b"%PDF-"):
+            return self.extract_text_from_pdf(uploaded_file)
+        elif head.startswith(b"PK\x03\x04"):  # DOCX is a ZIP archive
+            return self.extract_text_from_docx(uploaded_file)
+        
+        try:
+            return str(uploaded_file.read(), "utf-8")
+        except UnicodeDecodeError:
+            raise ValueError("Unsupported file type: upload a PDF, DOCX or UTF-8 text file")
+    
     def analyze_resume(self, resume_content, job_description=""):
         """Analyze resume using OpenAI"""
         if not self.openai_client:
             raise Exception("OpenAI client not initialized")
         
-        prompt = RESUME_OPTIMIZATION_PROMPTS["analyze"].format(
-            resume_content=resume_content,
-            job_description=job_description or "No specific job description provided"
-        )
+        resume_content = _fit(resume_content, _RESUME_TOKEN_BUDGET)
+        if not resume_content:
+            return ""
         
-        return self.openai_client.generate_completion(prompt, max_tokens=2000)
+        prompt = self._analyze_prompt(resume_content, job_description)
+        return self._complete(RESUME_OPTIMIZATION_PROMPTS["analyze_system"], prompt, 2000,
+                              "analyze", resume_content, job_description)
     
-    def optimize_resume_section(self, original_content, target_role, key_requirements):
-        """Optimize specific resume section"""
+    def submit_analysis_batch(self, resume_contents, job_description=""):
+        """Queue full analyses of several resumes on the Batch API
+        
+        Batches cost half as much but can take up to 24 hours. Returns the
+        batch id; results are keyed by each resume's position in the list.
+        """
         if not self.openai_client:
             raise Exception("OpenAI client not initialized")
         
-        prompt = RESUME_OPTIMIZATION_PROMPTS["optimize"].format(
+        requests = [
+            {
+                "custom_id": str(i),
+                "system_prompt": RESUME_OPTIMIZATION_PROMPTS["analyze_system"],
+                "prompt": self._analyze_prompt(_fit(content, _RESUME_TOKEN_BUDGET), job_description),
+                "max_tokens": 2000
+            }
+            for i, content in enumerate(resume_contents)
+        ]
+        return self.openai_client.submit_batch(requests)
+    
+    def fetch_analysis_batch(self, batch_id, count):
+        """Analyses from a finished batch in submission order, or None while it runs
+        
+        A resume whose request failed, or hadn't finished when the batch
+        expired or was cancelled, gets None in its place.
+        """
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
+        
+        results = self.openai_client.fetch_batch_results(batch_id)
+        if results is None:
+            return None
+        return [results.get(str(i)) for i in range(count)]
+    
+    def stream_analyze(self, resume_content, job_description=""):
+        """Streaming version of analyze_resume"""
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
+        
+        resume_content = _fit(resume_content, _RESUME_TOKEN_BUDGET)
+        if not resume_content:
+            return iter(())
+        
+        prompt = self._analyze_prompt(resume_content, job_description)
+        return self._complete_stream(RESUME_OPTIMIZATION_PROMPTS["analyze_system"], prompt, 2000,
+                                     "analyze", resume_content, job_description)
+    
+    def generate_full_report(self, resume_content, job_description="", target_role=""):
+        """Analysis, optimized content and keywords from a single request
+        
+        Returns a dict with "analysis" and "optimized" (Markdown strings) and
+        "keywords" (a list of strings).
+        """
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
+        
+        user_prompt = RESUME_OPTIMIZATION_PROMPTS["combined"].format(
+            resume_content=_fit(resume_content, _RESUME_TOKEN_BUDGET),
+            target_role=target_role or "Not specified",
+            job_description=job_description or "No specific job description provided"
+        )
+        report = self.openai_client.generate_json_completion(
+            RESUME_OPTIMIZATION_PROMPTS["combined_system"], user_prompt, max_tokens=3500
+        )
+        keywords = report.get("keywords") or []
+        return {
+            "analysis": str(report.get("analysis", "")),
+            "optimized": str(report.get("optimized", "")),
+            "keywords": [str(keyword) for keyword in keywords] if isinstance(keywords, list) else [str(keywords)]
+        }
+    
+    def _optimize_prompt(self, original_content, target_role, key_requirements):
+        """Build the prompt for optimizing one resume section"""
+        return RESUME_OPTIMIZATION_PROMPTS["optimize"].format(
             original_content=original_content,
             target_role=target_role,
             key_requirements=key_requirements
         )
+    
+    def optimize_resume_section(self, original_content, target_role, key_requirements):
+        """Optimize specific resume section"""
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
         
-        return self.openai_client.generate_completion(prompt, max_tokens=1500)
+        if not original_content.strip():
+            return ""
+        
+        prompt = self._optimize_prompt(original_content, target_role, key_requirements)
+        return self._complete(RESUME_OPTIMIZATION_PROMPTS["optimize_system"], prompt, 1500,
+                              "optimize", original_content, target_role, key_requirements)
+    
+    def stream_optimize_section(self, original_content, target_role, key_requirements):
+        """Streaming version of optimize_resume_section"""
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
+        
+        if not original_content.strip():
+            return iter(())
+        
+        prompt = self._optimize_prompt(original_content, target_role, key_requirements)
+        return self._complete_stream(RESUME_OPTIMIZATION_PROMPTS["optimize_system"], prompt, 1500,
+                                     "optimize", original_content, target_role, key_requirements)
     
     def generate_keywords(self, job_description):
         """Generate relevant keywords from job description"""
         if not self.openai_client:
             raise Exception("OpenAI client not initialized")
         
-        prompt = f"""
-        Analyze the following job description and extract the most important keywords and phrases that should be included in a resume:
+        prompt = RESUME_OPTIMIZATION_PROMPTS["keywords"].format(job_description=job_description)
+        return self._complete(RESUME_OPTIMIZATION_PROMPTS["keywords_system"], prompt, 1000,
+                              "keywords", job_description)
+    
+    async def aanalyze_resume(self, resume_content, job_description=""):
+        """Async version of analyze_resume"""
+        resume_content = _fit(resume_content, _RESUME_TOKEN_BUDGET)
+        if not resume_content:
+            return ""
         
-        Job Description:
-        {job_description}
+        prompt = self._analyze_prompt(resume_content, job_description)
+        return await self._acomplete(RESUME_OPTIMIZATION_PROMPTS["analyze_system"], prompt, 2000,
+                                     "analyze", resume_content, job_description)
+    
+    async def aoptimize_resume_section(self, original_content, target_role, key_requirements):
+        """Async version of optimize_resume_section"""
+        if not original_content.strip():
+            return ""
         
-        Please provide:
-        1. Technical skills and tools mentioned
-        2. Soft skills and competencies
-        3. Industry-specific terms
-        4. Action verbs that would be impactful
-        5. Certifications or qualifications mentioned
+        prompt = self._optimize_prompt(original_content, target_role, key_requirements)
+        return await self._acomplete(RESUME_OPTIMIZATION_PROMPTS["optimize_system"], prompt, 1500,
+                                     "optimize", original_content, target_role, key_requirements)
+    
+    async def agenerate_keywords(self, job_description):
+        """Async version of generate_keywords"""
+        prompt = RESUME_OPTIMIZATION_PROMPTS["keywords"].format(job_description=job_description)
+        return await self._acomplete(RESUME_OPTIMIZATION_PROMPTS["keywords_system"], prompt, 1000,
+                                     "keywords", job_description)
+    
+    def run_all(self, resume_content, job_description="", target_role=""):
+        """Analysis, keywords and section optimization as concurrent requests
         
-        Format as a structured list with categories.
+        Keywords need a job description and optimization a target role; each
+        is skipped (None) without one. Returns a dict with "analysis",
+        "keywords" and "optimized", holding the exception in place of any
+        request that failed. Requests still go through the client's rate
+        limiter, so the burst stays within the account's limits.
         """
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
+        
+        async def skipped():
+            return None
+        
+        key_reqs = "Based on the job description provided" if job_description else "General best practices"
+        
+        async def gather():
+            return await asyncio.gather(
+                self.aanalyze_resume(resume_content, job_description),
+                self.agenerate_keywords(job_description) if job_description else skipped(),
+                self.aoptimize_resume_section(_fit(resume_content, 2500), target_role, key_reqs)
+                if target_role else skipped(),
+                return_exceptions=True
+            )
+        
+        analysis, keywords, optimized = self.openai_client.run_async(gather())
+        return {"analysis": analysis, "keywords": keywords, "optimized": optimized}
+    
+    def generate_keywords_batch(self, job_descriptions):
+        """Extract keywords for several job descriptions
         
-        return self.openai_client.generate_completion(prompt, max_tokens=1000)
+        Job descriptions are sent _KEYWORD_BATCH_SIZE to a request, with the
+        requests running concurrently. Returns one list of keywords per job
+        description, in order (empty if its request failed).
+        """
+        if not self.openai_client:
+            raise Exception("OpenAI client not initialized")
+        
+        batches = [job_descriptions[start:start + _KEYWORD_BATCH_SIZE]
+                   for start in range(0, len(job_descriptions), _KEYWORD_BATCH_SIZE)]
+        prompts = [
+            _KEYWORDS_BATCH_TEMPLATE.format(
+                count=len(batch),
+                job_descriptions="\n\n".join(f"===JD {i}===\n{jd}" for i, jd in enumerate(batch, 1))
+            )
+            for batch in batches
+        ]
+        responses = self.openai_client.generate_many(
+            prompts, max_tokens=min(300 * _KEYWORD_BATCH_SIZE, 4000), response_format={"type": "json_object"}
+        )
+        
+        keywords = []
+        for batch, response in zip(batches, responses):
+            batch_keywords = [[] for _ in batch]
+            if not isinstance(response, Exception):
+                try:
+                    results = json.loads(response).get("results", [])
+                except ValueError:
+                    results = []
+                for entry in results:
+                    index = entry.get("index")
+                    if isinstance(index, int) and 1 <= index <= len(batch) and isinstance(entry.get("keywords"), list):
+                        batch_keywords[index - 1] = [str(keyword) for keyword in entry["keywords"]]
+            keywords.extend(batch_keywords)
+        return keywords
+
+def _key_hash(api_key):
+    """Fingerprint an API key so it can key a cache without being stored in it"""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+@st.cache_resource(show_spinner=False)
+def get_optimizer(api_key_hash, _api_key):
+    """Initialized optimizer for an API key, shared across reruns and sessions"""
+    optimizer = ResumeOptimizer()
+    success, message = optimizer.initialize_openai(_api_key)
+    if not success:
+        # Raising keeps the failure out of the cache
+        raise RuntimeError(message)
+    return optimizer
 
 def main():
     st.set_page_config(
@@ -113,9 +551,8 @@ def main():
     Upload your resume and get personalized recommendations to improve your chances of landing interviews.
     """)
     
-    # Initialize the optimizer
-    if 'optimizer' not in st.session_state:
-        st.session_state.optimizer = ResumeOptimizer()
+    # Text extraction works without AI; an API key swaps in the shared, initialized optimizer
+    optimizer = ResumeOptimizer()
     
     # Sidebar for API configuration
     with st.sidebar:
@@ -126,15 +563,47 @@ def main():
                                help="Enter your OpenAI API key to use AI features")
         
         if api_key:
-            os.environ['OPENAI_API_KEY'] = api_key
-            if st.button("Initialize AI"):
-                success, message = st.session_state.optimizer.initialize_openai()
-                if success:
-                    st.success(message)
-                    st.session_state.ai_initialized = True
-                else:
-                    st.error(message)
-                    st.session_state.ai_initialized = False
+            try:
+                optimizer = get_optimizer(_key_hash(api_key), api_key)
+                st.success("AI ready")
+            except Exception as e:
+                st.error(str(e))
+        
+        # Bulk keyword extraction
+        st.markdown("---")
+        st.header("📑 Bulk JD Keywords")
+        jd_csv = st.file_uploader("Bulk JD upload (CSV)", type=['csv'],
+                                  help="One job description per row, in a 'job_description' column "
+                                       "(or the first column)")
+        if jd_csv and st.button("Extract Keywords for All"):
+            if not optimizer.openai_client:
+                st.error("Please configure your OpenAI API key first!")
+            else:
+                try:
+                    reader = csv.DictReader(io.StringIO(jd_csv.getvalue().decode("utf-8-sig")))
+                    columns = reader.fieldnames or []
+                    column = "job_description" if "job_description" in columns else (columns[0] if columns else None)
+                    job_descriptions = [jd for jd in ((row.get(column) or "").strip() for row in reader) if jd]
+                    
+                    if not job_descriptions:
+                        st.error("No job descriptions found in the CSV!")
+                    else:
+                        with st.spinner(f"Extracting keywords for {len(job_descriptions)} job descriptions..."):
+                            all_keywords = optimizer.generate_keywords_batch(job_descriptions)
+                        
+                        output = io.StringIO()
+                        writer = csv.writer(output)
+                        writer.writerow(["job_description", "keywords"])
+                        for jd, keywords in zip(job_descriptions, all_keywords):
+                            writer.writerow([jd, ", ".join(keywords)])
+                        
+                        st.success(f"Extracted keywords for {sum(1 for k in all_keywords if k)} of {len(job_descriptions)} job descriptions")
+                        st.download_button("📥 Download Keywords CSV", output.getvalue(),
+                                           file_name="jd_keywords.csv", mime="text/csv")
+                except UnicodeDecodeError:
+                    st.error("Couldn't read the CSV: please save it as UTF-8 (\"CSV UTF-8\" in Excel)")
+                except Exception as e:
+                    st.error(f"Error extracting keywords: {str(e)}")
         
         # Service information
         st.markdown("---")
@@ -158,18 +627,13 @@ def main():
         uploaded_file = st.file_uploader(
             "Choose your resume file",
             type=['pdf', 'docx', 'txt'],
-            help="Supported formats: PDF, DOCX, TXT"
+            help=f"Supported formats: PDF, DOCX, TXT (up to {MAX_UPLOAD_MB} MB)"
         )
         
         resume_text = ""
         if uploaded_file:
             try:
-                if uploaded_file.type == "application/pdf":
-                    resume_text = st.session_state.optimizer.extract_text_from_pdf(uploaded_file)
-                elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                    resume_text = st.session_state.optimizer.extract_text_from_docx(uploaded_file)
-                else:  # txt file
-                    resume_text = str(uploaded_file.read(), "utf-8")
+                resume_text = optimizer.extract_text(uploaded_file)
                 
                 st.success("Resume uploaded successfully!")
                 
@@ -204,12 +668,14 @@ def main():
         st.header("🔍 Analysis Options")
         analysis_type = st.radio(
             "Choose analysis type:",
-            ["Full Resume Analysis", "Section Optimization", "Keyword Extraction"]
+            ["Full Resume Analysis", "Section Optimization", "Keyword Extraction", "All-in-One Report"],
+            help="All-in-One Report runs the analysis, optimization and keyword extraction "
+                 "in a single request when you click Analyze Resume"
         )
     
     # Action buttons
     st.markdown("---")
-    col_btn1, col_btn2, col_btn3 = st.columns(3)
+    col_btn1, col_btn2, col_btn3, col_btn4 = st.columns(4)
     
     with col_btn1:
         analyze_btn = st.button("🔍 Analyze Resume", type="primary", use_container_width=True)
@@ -220,13 +686,71 @@ def main():
     with col_btn3:
         keywords_btn = st.button("🏷️ Extract Keywords", use_container_width=True)
     
+    with col_btn4:
+        run_all_btn = st.button("⚡ Run All", use_container_width=True,
+                                help="Analysis, keywords (with a job description) and section "
+                                     "optimization (with a target role) at the same time")
+    
+    # Overnight bulk analysis through the Batch API
+    with st.expander("🌙 Overnight Bulk Analysis (50% cheaper, results within 24h)"):
+        batch_files = st.file_uploader(
+            "Resumes to analyze",
+            type=['pdf', 'docx', 'txt'],
+            accept_multiple_files=True,
+            help="Each resume gets a full analysis against the job description above"
+        )
+        
+        if st.button("🌙 Submit to Overnight Batch", disabled=not batch_files):
+            if not optimizer.openai_client:
+                st.error("Please configure your OpenAI API key first!")
+            else:
+                try:
+                    names = [batch_file.name for batch_file in batch_files]
+                    contents = [optimizer.extract_text(batch_file) for batch_file in batch_files]
+                    batch_id = optimizer.submit_analysis_batch(contents, job_description)
+                    st.session_state.analysis_batch = {'id': batch_id, 'names': names}
+                    st.success(f"Submitted batch {batch_id} with {len(names)} resumes.")
+                except Exception as e:
+                    st.error(f"Error submitting batch: {str(e)}")
+        
+        analysis_batch = st.session_state.get('analysis_batch')
+        if analysis_batch:
+            st.caption(f"Pending batch: {analysis_batch['id']} ({len(analysis_batch['names'])} resumes)")
+            if st.button("🔍 Check Batch Status"):
+                try:
+                    analyses = optimizer.fetch_analysis_batch(
+                        analysis_batch['id'], len(analysis_batch['names'])
+                    )
+                    if analyses is None:
+                        batch = optimizer.openai_client.poll_batch(analysis_batch['id'])
+                        st.info(f"Batch is {batch.status}")
+                    else:
+                        st.session_state.batch_analyses = list(zip(analysis_batch['names'], analyses))
+                        del st.session_state.analysis_batch
+                except BatchFailedError as e:
+                    # It will never finish, so stop tracking it
+                    del st.session_state.analysis_batch
+                    st.error(str(e))
+                except Exception as e:
+                    st.error(f"Error checking batch: {str(e)}")
+        
+        batch_analyses = st.session_state.get('batch_analyses')
+        if batch_analyses:
+            report = "\n\n".join(
+                f"{'=' * 50}\n{name}\n{'=' * 50}\n\n{analysis or 'Analysis failed for this resume.'}"
+                for name, analysis in batch_analyses
+            )
+            st.success(f"Batch finished: {sum(1 for _, analysis in batch_analyses if analysis)} analyses ready")
+            st.download_button("📥 Download All Analyses", report,
+                               file_name="resume_batch_analyses.txt", mime="text/plain")
+    
     # Results area
-    if analyze_btn or optimize_btn or keywords_btn:
-        if not getattr(st.session_state, 'ai_initialized', False):
+    if analyze_btn or optimize_btn or keywords_btn or run_all_btn:
+        if not optimizer.openai_client:
             st.error("Please configure your OpenAI API key first!")
             return
         
-        if not resume_text:
+        if not resume_text.strip():
             st.error("Please upload a resume or paste resume content!")
             return
         
@@ -234,45 +758,86 @@ def main():
         st.header("📊 AI Analysis Results")
         
         try:
-            with st.spinner("AI is analyzing your resume..."):
-                if analyze_btn and analysis_type == "Full Resume Analysis":
-                    result = st.session_state.optimizer.analyze_resume(resume_text, job_description)
-                    
-                    st.subheader("📋 Complete Resume Analysis")
-                    st.markdown(result)
-                    
-                    # Download results
-                    st.download_button(
-                        label="📥 Download Analysis",
-                        data=result,
-                        file_name="resume_analysis.txt",
-                        mime="text/plain"
-                    )
+            if run_all_btn:
+                with st.spinner("AI is analyzing your resume..."):
+                    results = optimizer.run_all(resume_text, job_description, target_role)
                 
-                elif optimize_btn and analysis_type == "Section Optimization":
-                    if not target_role:
-                        st.error("Please specify a target role for section optimization!")
-                        return
-                    
-                    # For demo, optimize the whole resume as one section
-                    key_reqs = "Based on the job description provided" if job_description else "General best practices"
-                    result = st.session_state.optimizer.optimize_resume_section(
-                        resume_text[:1000],  # Limit for demo
-                        target_role,
-                        key_reqs
+                for title, name in [("📋 Complete Resume Analysis", "analysis"),
+                                    ("🏷️ Relevant Keywords", "keywords"),
+                                    ("✨ Optimized Content", "optimized")]:
+                    result = results[name]
+                    if result is None:
+                        continue
+                    st.subheader(title)
+                    if isinstance(result, Exception):
+                        st.error(f"Error during analysis: {str(result)}")
+                    else:
+                        st.markdown(result)
+            
+            elif analyze_btn and analysis_type == "All-in-One Report":
+                with st.spinner("AI is analyzing your resume..."):
+                    report = optimizer.generate_full_report(
+                        resume_text, job_description, target_role
                     )
-                    
-                    st.subheader("✨ Optimized Content")
-                    st.markdown(result)
                 
-                elif keywords_btn and job_description:
-                    result = st.session_state.optimizer.generate_keywords(job_description)
-                    
-                    st.subheader("🏷️ Relevant Keywords")
-                    st.markdown(result)
+                st.subheader("📋 Complete Resume Analysis")
+                st.markdown(report["analysis"])
+                
+                st.subheader("✨ Optimized Content")
+                st.markdown(report["optimized"])
+                
+                st.subheader("🏷️ Relevant Keywords")
+                st.markdown(" ".join(f"`{keyword}`" for keyword in report["keywords"]))
+                
+                # Download results
+                st.download_button(
+                    label="📥 Download Report",
+                    data="\n\n".join([
+                        "ANALYSIS\n\n" + report["analysis"],
+                        "OPTIMIZED CONTENT\n\n" + report["optimized"],
+                        "KEYWORDS\n\n" + ", ".join(report["keywords"])
+                    ]),
+                    file_name="resume_report.txt",
+                    mime="text/plain"
+                )
+            
+            elif analyze_btn and analysis_type == "Full Resume Analysis":
+                st.subheader("📋 Complete Resume Analysis")
+                # Render the analysis as it is written
+                result = st.write_stream(optimizer.stream_analyze(resume_text, job_description))
+                
+                # Download results
+                st.download_button(
+                    label="📥 Download Analysis",
+                    data=result,
+                    file_name="resume_analysis.txt",
+                    mime="text/plain"
+                )
+            
+            elif optimize_btn and analysis_type == "Section Optimization":
+                if not target_role:
+                    st.error("Please specify a target role for section optimization!")
+                    return
+                
+                # For demo, optimize the whole resume as one section
+                key_reqs = "Based on the job description provided" if job_description else "General best practices"
+                
+                st.subheader("✨ Optimized Content")
+                st.write_stream(optimizer.stream_optimize_section(
+                    _fit(resume_text, 2500),
+                    target_role,
+                    key_reqs
+                ))
+            
+            elif keywords_btn and job_description:
+                with st.spinner("AI is analyzing your resume..."):
+                    result = optimizer.generate_keywords(job_description)
                 
-                elif keywords_btn and not job_description:
-                    st.error("Please provide a job description to extract keywords!")
+                st.subheader("🏷️ Relevant Keywords")
+                st.markdown(result)
+            
+            elif keywords_btn and not job_description:
+                st.error("Please provide a job description to extract keywords!")
         
         except Exception as e:
             st.error(f"Error during analysis: {str(e)}")
@@ -0,0 +1,53 @@
+import io
+import sys
+import types
+from pathlib import Path
+
+from docx import Document
+from docx.enum.text import WD_TAB_ALIGNMENT
+from docx.shared import Inches
+
+# The shared utilities live in ai-automation/shared-utils, which can't be
+# imported under that name, so expose the folder as shared_utils first
+shared_utils = types.ModuleType("shared_utils")
+shared_utils.__path__ = [str(Path(__file__).resolve().parent.parent / "shared-utils")]
+sys.modules.setdefault("shared_utils", shared_utils)
+
+from app import ResumeOptimizer
+
+
+def build_docx(*paragraphs, tab_stop=None):
+    """Build a DOCX in memory, one paragraph per string."""
+    document = Document()
+    for text in paragraphs:
+        paragraph = document.add_paragraph(text)
+        if tab_stop is not None:
+            paragraph.paragraph_format.tab_stops.add_tab_stop(tab_stop, WD_TAB_ALIGNMENT.RIGHT)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    buffer.seek(0)
+    return buffer
+
+
+class TestDocxExtraction:
+    """Test suite for the streaming DOCX text extraction."""
+
+    def setup_method(self):
+        """Create a fresh optimizer for each test."""
+        self.optimizer = ResumeOptimizer()
+
+    def test_tab_stops_are_not_text(self):
+        """Tab stop definitions don't add tabs, only the ones in runs do."""
+        docx_file = build_docx("Jane Doe", "Engineer\t2020-2024", tab_stop=Inches(6))
+
+        assert self.optimizer.extract_text_from_docx(docx_file) == "Jane Doe\nEngineer\t2020-2024"
+
+    def test_matches_python_docx(self):
+        """The XML extraction gives the same text as python-docx."""
+        paragraphs = ("Jane Doe", "jane@example.com | 555-0100", "Engineer\t2020-2024", "Python, SQL")
+        docx_file = build_docx(*paragraphs, tab_stop=Inches(6))
+
+        expected = "\n".join(p.text for p in Document(docx_file).paragraphs).strip()
+        docx_file.seek(0)
+
+        assert self.optimizer.extract_text_from_docx(docx_file) == expected
@@ -2,20 +2,218 @@
 Shared OpenAI API utilities for AI automation projects
 """
 import os
-from openai import OpenAI
+import asyncio
+import contextvars
+import functools
+import hashlib
+import importlib.util
+import json
+import sqlite3
+import threading
+import time
+import httpx
+from openai import OpenAI, AsyncOpenAI, APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
 from dotenv import load_dotenv
 import streamlit as st
 
+# HTTP/2 support for httpx (optional, needs the h2 package); httpx imports
+# it itself, so only check that it's installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Faster JSON parsing (optional, falls back to the standard library)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
+# Persistent response cache, so repeat requests survive restarts and are
+# shared between Streamlit processes. Entries are stored in plain text, so
+# it is opt-in (use_cache=True) for content that is fine to keep on disk
+CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "ai-automation", "completions.db")
+CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+_cache_lock = threading.Lock()
+_cache_conn = None
+
+def _cache_db():
+    """Open the response cache on first use, sweeping out expired entries"""
+    global _cache_conn
+    if _cache_conn is None:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(CACHE_PATH, check_same_thread=False)
+        conn.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, response TEXT, ts INTEGER)")
+        conn.execute("DELETE FROM cache WHERE ts < ?", (int(time.time()) - CACHE_TTL_SECONDS,))
+        conn.commit()
+        _cache_conn = conn
+    return _cache_conn
+
+def _cache_key(**request):
+    """Stable fingerprint of everything that affects a completion"""
+    data = json.dumps(request, sort_keys=True).encode()
+    # Not a security use, so the faster MD5 is fine (the flag needs Python 3.9+)
+    try:
+        return hashlib.md5(data, usedforsecurity=False).hexdigest()
+    except TypeError:
+        return hashlib.md5(data).hexdigest()
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, with orjson when it's installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _cache_get(key):
+    """Cached response for key, or None on a miss (or if the cache is unusable)"""
+    try:
+        with _cache_lock:
+            row = _cache_db().execute("SELECT response, ts FROM cache WHERE key = ?", (key,)).fetchone()
+    except (sqlite3.Error, OSError):
+        return None
+    if row is None or row[1] < time.time() - CACHE_TTL_SECONDS:
+        return None
+    return _json_loads(row[0])
+
+def _cache_put(key, response):
+    """Store a response; caching is best-effort and never fails the request"""
+    try:
+        with _cache_lock:
+            db = _cache_db()
+            db.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                       (key, json.dumps(response), int(time.time())))
+            db.commit()
+    except (sqlite3.Error, OSError):
+        pass
+
+# Client-side pacing, so bursts of concurrent requests stay under the account's
+# limits instead of running into 429s; override to match your usage tier
+RATE_LIMIT_RPM = int(os.getenv("OPENAI_RPM_LIMIT", "3500"))
+RATE_LIMIT_TPM = int(os.getenv("OPENAI_TPM_LIMIT", "60000"))
+
+class RateLimiter:
+    """Token bucket limiting requests and tokens per minute
+    
+    Each call reserves one request and its estimated tokens. When a bucket
+    runs short the reservation is still taken and the caller waits until
+    the bucket has refilled, so waiting callers are served in order.
+    """
+    
+    def __init__(self, rpm=RATE_LIMIT_RPM, tpm=RATE_LIMIT_TPM):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.available_requests = float(rpm)
+        self.available_tokens = float(tpm)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, tokens):
+        """Take one request and `tokens` from the buckets, returning the wait in seconds"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self.last_refill
+            self.last_refill = now
+            self.available_requests = min(self.rpm, self.available_requests + elapsed * self.rpm / 60)
+            self.available_tokens = min(self.tpm, self.available_tokens + elapsed * self.tpm / 60)
+            
+            self.available_requests -= 1
+            self.available_tokens -= min(tokens, self.tpm)
+            return max(0.0,
+                       -self.available_requests * 60 / self.rpm,
+                       -self.available_tokens * 60 / self.tpm)
+    
+    def wait(self, tokens):
+        """Block until a request of `tokens` estimated tokens may be sent"""
+        delay = self._reserve(tokens)
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire(self, tokens):
+        """Async version of wait"""
+        delay = self._reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+
+def _estimate_tokens(prompt, max_tokens, n=1):
+    """Rough token cost of a request: ~4 characters per prompt token plus the output"""
+    return len(prompt) // 4 + max_tokens * n
+
+def _retry_after(error):
+    """Seconds the API asked us to wait before retrying, if it said"""
+    response = getattr(error, "response", None)
+    try:
+        return float(response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+# Connection pool sizes for both the sync and async HTTP clients
+_HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+
+@functools.lru_cache(maxsize=8)
+def _get_client(api_key):
+    """Shared OpenAI client for an API key
+    
+    Every OpenAIClient with the same key reuses one connection pool, so
+    Streamlit reruns don't pay for new TCP and TLS handshakes.
+    """
+    return OpenAI(
+        api_key=api_key,
+        http_client=httpx.Client(http2=HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+    )
+
+# Transient API failures worth retrying in generate_many
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+class BatchFailedError(Exception):
+    """A Batch API job that failed outright, so it will never have results"""
+
+def _completion_text(response, n=1):
+    """Extract the text of a chat completion response (a list when n > 1)"""
+    if n == 1:
+        return response.choices[0].message.content.strip()
+    return [choice.message.content.strip() for choice in response.choices]
+
+def _is_cacheable(finish_reasons, texts, response_format):
+    """Whether a response is complete and usable, so safe to cache
+    
+    Truncated responses (finish_reason "length") and, in JSON mode, output
+    that doesn't parse would otherwise be served back for every retry.
+    """
+    if any(reason != "stop" for reason in finish_reasons):
+        return False
+    if (response_format or {}).get("type") == "json_object":
+        try:
+            for text in texts:
+                _json_loads(text)
+        except ValueError:
+            return False
+    return True
+
+def _messages(prompt, system_prompt=None):
+    """Chat messages for a prompt, led by the system prompt when there is one
+    
+    Keeping static instructions in an unchanging system prompt ahead of the
+    variable content lets OpenAI's prompt caching reuse the shared prefix.
+    """
+    if system_prompt:
+        return [{"role": "system", "content": system_prompt}, {"role": "user", "content": prompt}]
+    return [{"role": "user", "content": prompt}]
+
+def _response_format_kwargs(response_format):
+    """Only send response_format when one was requested"""
+    return {"response_format": response_format} if response_format else {}
+
 class OpenAIClient:
-    def __init__(self):
+    def __init__(self, api_key=None):
         """Initialize OpenAI client with API key"""
-        # Try to get API key from environment or Streamlit secrets
-        self.api_key = None
+        # Use the given key, else try the environment or Streamlit secrets
+        self.api_key = api_key
         
-        if 'OPENAI_API_KEY' in os.environ:
+        if self.api_key:
+            pass
+        elif 'OPENAI_API_KEY' in os.environ:
             self.api_key = os.environ['OPENAI_API_KEY']
         elif hasattr(st, 'secrets') and 'OPENAI_API_KEY' in st.secrets:
             self.api_key = st.secrets['OPENAI_API_KEY']
@@ -23,38 +221,295 @@ class OpenAIClient:
         if not self.api_key:
             raise ValueError("OpenAI API key not found. Please set OPENAI_API_KEY environment variable or in Streamlit secrets.")
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = _get_client(self.api_key)
+        # The async client of the current run_async call, if any
+        self._async_client = contextvars.ContextVar("async_client", default=None)
+        self.rate_limiter = RateLimiter()
+    
+    def _get_async_client(self):
+        """Return the AsyncOpenAI client of the enclosing run_async call"""
+        client = self._async_client.get()
+        if client is None:
+            raise RuntimeError("Async OpenAIClient methods must be run through run_async")
+        return client
+    
+    def run_async(self, coroutine):
+        """Run a coroutine using the async methods to completion, for use from Streamlit
+        
+        Pooled connections can't outlive the event loop they were opened on,
+        so each run gets its own AsyncOpenAI client, closed when the run ends.
+        """
+        async def main():
+            client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+            )
+            self._async_client.set(client)
+            try:
+                return await coroutine
+            finally:
+                await client.close()
+        
+        return asyncio.run(main())
     
-    def generate_completion(self, prompt, model="gpt-3.5-turbo", max_tokens=1500, temperature=0.7):
-        """Generate text completion using OpenAI API"""
+    def generate_completion(self, prompt, model="gpt-3.5-turbo", max_tokens=1500, temperature=0.7, n=1,
+                            response_format=None, use_cache=False, system_prompt=None):
+        """Generate text completion using OpenAI API
+        
+        With n > 1 the API returns n independent completions of the same prompt
+        in one request, and a list of strings is returned instead of a string.
+        Pass response_format={"type": "json_object"} to request JSON output.
+        With use_cache=True responses are cached on disk (see CACHE_PATH),
+        unless they were cut off or, in JSON mode, aren't valid JSON.
+        An optional system_prompt is sent ahead of the prompt.
+        """
+        key = _cache_key(model=model, system_prompt=system_prompt, prompt=prompt, max_tokens=max_tokens,
+                         temperature=temperature, n=n, response_format=response_format)
+        if use_cache:
+            cached = _cache_get(key)
+            if cached is not None:
+                return cached
+        
+        self.rate_limiter.wait(_estimate_tokens(prompt, max_tokens, n))
         try:
             response = self.client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
+                messages=_messages(prompt, system_prompt),
                 max_tokens=max_tokens,
-                temperature=temperature
+                temperature=temperature,
+                n=n,
+                **_response_format_kwargs(response_format)
             )
-            return response.choices[0].message.content.strip()
+            result = _completion_text(response, n)
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}") from e
+        
+        if use_cache and _is_cacheable([choice.finish_reason for choice in response.choices],
+                                       [result] if n == 1 else result, response_format):
+            _cache_put(key, result)
+        return result
+    
+    async def agenerate_completion(self, prompt, model="gpt-3.5-turbo", max_tokens=1500, temperature=0.7, n=1,
+                                   response_format=None, use_cache=False, system_prompt=None):
+        """Async version of generate_completion for running requests concurrently (see run_async)"""
+        key = _cache_key(model=model, system_prompt=system_prompt, prompt=prompt, max_tokens=max_tokens,
+                         temperature=temperature, n=n, response_format=response_format)
+        if use_cache:
+            cached = _cache_get(key)
+            if cached is not None:
+                return cached
+        
+        await self.rate_limiter.acquire(_estimate_tokens(prompt, max_tokens, n))
+        try:
+            response = await self._get_async_client().chat.completions.create(
+                model=model,
+                messages=_messages(prompt, system_prompt),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                n=n,
+                **_response_format_kwargs(response_format)
+            )
+            result = _completion_text(response, n)
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}") from e
+        
+        if use_cache and _is_cacheable([choice.finish_reason for choice in response.choices],
+                                       [result] if n == 1 else result, response_format):
+            _cache_put(key, result)
+        return result
+    
+    async def agenerate_many(self, prompts, max_concurrency=5, max_attempts=3, **kwargs):
+        """Run completions for several prompts concurrently
+        
+        At most max_concurrency requests are in flight at once. Requests that
+        fail with a rate limit, timeout, connection or server error are retried
+        after the API's retry-after delay (or with exponential backoff), up to
+        max_attempts tries in total. Returns
+        the results in prompt order, with the exception in place of any
+        prompt that still failed. Other keyword arguments are passed on to
+        agenerate_completion. A prompt may also be a dict with a "prompt"
+        and its own keyword arguments, which override the shared ones.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(prompt):
+            request = dict(kwargs, **prompt) if isinstance(prompt, dict) else dict(kwargs, prompt=prompt)
+            for attempt in range(max_attempts):
+                try:
+                    async with semaphore:
+                        return await self.agenerate_completion(**request)
+                except Exception as e:
+                    if attempt == max_attempts - 1 or not isinstance(e.__cause__, _RETRYABLE_ERRORS):
+                        return e
+                    delay = _retry_after(e.__cause__) or 2 ** attempt
+                await asyncio.sleep(delay)
+        
+        return await asyncio.gather(*[run(prompt) for prompt in prompts])
+    
+    def generate_many(self, prompts, max_concurrency=5, max_attempts=3, **kwargs):
+        """Blocking wrapper around agenerate_many for use from Streamlit"""
+        return self.run_async(self.agenerate_many(prompts, max_concurrency, max_attempts, **kwargs))
+    
+    def generate_completion_stream(self, prompt, model="gpt-3.5-turbo", max_tokens=1500, temperature=0.7,
+                                   use_cache=False, system_prompt=None):
+        """Yield the completion text piece by piece as the API produces it
+        
+        With use_cache=True a cached response is yielded in one piece and a
+        freshly streamed one is added to the cache once the stream has finished.
+        """
+        key = _cache_key(model=model, system_prompt=system_prompt, prompt=prompt, max_tokens=max_tokens,
+                         temperature=temperature, n=1, response_format=None)
+        if use_cache:
+            cached = _cache_get(key)
+            if cached is not None:
+                yield cached
+                return
+        
+        self.rate_limiter.wait(_estimate_tokens(prompt, max_tokens))
+        parts = []
+        finish_reason = None
+        try:
+            stream = self.client.chat.completions.create(
+                model=model,
+                messages=_messages(prompt, system_prompt),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    parts.append(content)
+                    yield content
+                finish_reason = chunk.choices[0].finish_reason or finish_reason
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}") from e
+        
+        result = "".join(parts).strip()
+        if use_cache and _is_cacheable([finish_reason], [result], None):
+            _cache_put(key, result)
+    
+    def submit_batch(self, requests, model="gpt-3.5-turbo", temperature=0.7):
+        """Submit completions to the Batch API and return the batch id
+        
+        Batches cost half as much as regular requests but finish within 24h,
+        so they suit non-interactive jobs. Each request is a dict with a
+        unique "custom_id" and a "prompt", plus optional "system_prompt",
+        "max_tokens", "n" and "response_format".
+        """
+        lines = []
+        for request in requests:
+            body = {
+                "model": model,
+                "messages": _messages(request["prompt"], request.get("system_prompt")),
+                "max_tokens": request.get("max_tokens", 1500),
+                "temperature": temperature,
+                "n": request.get("n", 1)
+            }
+            body.update(_response_format_kwargs(request.get("response_format")))
+            lines.append(json.dumps({
+                "custom_id": request["custom_id"],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body
+            }))
+        
+        try:
+            batch_file = self.client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode()),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            return batch.id
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}") from e
+    
+    def poll_batch(self, batch_id):
+        """Return the current state of a submitted batch"""
+        try:
+            return self.client.batches.retrieve(batch_id)
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}") from e
+    
+    def fetch_batch_results(self, batch_id):
+        """Results of a finished batch, keyed by custom_id
+        
+        Returns None while the batch is still running. Each result is the
+        completion text (a list when the request used n > 1), or None if that
+        request failed. Expired and cancelled batches return whatever had
+        finished when they stopped, with the rest missing. Raises
+        BatchFailedError for a batch that failed outright.
+        """
+        batch = self.poll_batch(batch_id)
+        if batch.status == "failed":
+            errors = getattr(batch.errors, "data", None) or []
+            reason = errors[0].message if errors else "no details given"
+            raise BatchFailedError(f"Batch {batch_id} failed: {reason}")
+        if batch.status not in ("completed", "expired", "cancelled"):
+            return None
+        
+        results = {}
+        try:
+            if batch.output_file_id:
+                output = self.client.files.content(batch.output_file_id).text
+                for line in output.splitlines():
+                    if not line.strip():
+                        continue
+                    entry = _json_loads(line)
+                    response = entry.get("response") or {}
+                    if response.get("status_code") != 200:
+                        results[entry["custom_id"]] = None
+                        continue
+                    texts = [choice["message"]["content"].strip() for choice in response["body"]["choices"]]
+                    results[entry["custom_id"]] = texts[0] if len(texts) == 1 else texts
         except Exception as e:
-            raise Exception(f"OpenAI API error: {str(e)}")
+            raise Exception(f"OpenAI API error: {str(e)}") from e
+        return results
     
     def generate_structured_completion(self, system_prompt, user_prompt, model="gpt-3.5-turbo", max_tokens=1500, temperature=0.7):
         """Generate structured completion with system and user prompts"""
         try:
             response = self.client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
+                messages=_messages(user_prompt, system_prompt),
                 max_tokens=max_tokens,
                 temperature=temperature
             )
             return response.choices[0].message.content.strip()
         except Exception as e:
-            raise Exception(f"OpenAI API error: {str(e)}")
+            raise Exception(f"OpenAI API error: {str(e)}") from e
+
+    def generate_json_completion(self, system_prompt, user_prompt, model="gpt-3.5-turbo", max_tokens=1500,
+                                 temperature=0.7):
+        """Run a JSON-mode completion and return the parsed object
+        
+        Raises if the response was cut off at max_tokens or isn't valid JSON.
+        """
+        self.rate_limiter.wait(_estimate_tokens(system_prompt + user_prompt, max_tokens))
+        try:
+            response = self.client.chat.completions.create(
+                model=model,
+                messages=_messages(user_prompt, system_prompt),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                response_format={"type": "json_object"}
+            )
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}") from e
+        
+        choice = response.choices[0]
+        if choice.finish_reason == "length":
+            raise Exception(f"OpenAI response was cut off at {max_tokens} tokens; try shorter input")
+        try:
+            return _json_loads(choice.message.content)
+        except ValueError as e:
+            raise Exception(f"OpenAI returned invalid JSON: {str(e)}") from e
 
 def test_openai_connection():
     """Test OpenAI API connection"""
@@ -66,15 +521,19 @@ def test_openai_connection():
         return False, str(e)
 
 # Prompt templates for different use cases
+# Static instructions live in the "*_system" prompts and the variable content
+# in the user templates that follow, so every request shares the same prefix
 RESUME_OPTIMIZATION_PROMPTS = {
-    "analyze": """
-    Analyze the following resume and provide detailed feedback on:
+    "analyze_system": """
+    Analyze the resume you are given and provide detailed feedback on:
     1. Content gaps and missing keywords
     2. Structure and formatting improvements
     3. ATS (Applicant Tracking System) compatibility
     4. Industry-specific optimizations
     5. Impact statement improvements
+    """,
     
+    "analyze": """
     Resume Content:
     {resume_content}
     
@@ -82,20 +541,72 @@ RESUME_OPTIMIZATION_PROMPTS = {
     {job_description}
     """,
     
+    "optimize_system": """
+    Rewrite and optimize the resume section you are given to be more impactful, ATS-friendly, and aligned with the target role.
+    
+    Please provide an improved version that:
+    - Uses strong action verbs and quantified achievements
+    - Includes relevant keywords
+    - Is concise yet comprehensive
+    - Follows best practices for ATS systems
+    """,
+    
     "optimize": """
-    Rewrite and optimize the following resume section to be more impactful, ATS-friendly, and aligned with the target role:
+    Target Role: {target_role}
+    Key Requirements: {key_requirements}
     
     Original Content:
     {original_content}
+    """,
+    
+    "keywords_system": """
+    Analyze the job description you are given and extract the most important keywords and phrases that should be included in a resume.
+    
+    Please provide:
+    1. Technical skills and tools mentioned
+    2. Soft skills and competencies
+    3. Industry-specific terms
+    4. Action verbs that would be impactful
+    5. Certifications or qualifications mentioned
+    
+    Format as a structured list with categories.
+    """,
+    
+    "keywords": """
+    Job Description:
+    {job_description}
+    """,
+    
+    # Analysis, optimization and keywords in one JSON-mode request, so the
+    # resume is only sent once; used as the system prompt with "combined"
+    "combined_system": """
+    You are an expert resume reviewer and ATS (Applicant Tracking System) specialist.
+    For the resume you are given, complete all three tasks below and return a single JSON object
+    of the form {"analysis": str, "optimized": str, "keywords": [str]}.
+    
+    analysis: detailed feedback in Markdown on
+    1. Content gaps and missing keywords
+    2. Structure and formatting improvements
+    3. ATS compatibility
+    4. Industry-specific optimizations
+    5. Impact statement improvements
+    
+    optimized: an improved version of the resume's content for the target role that uses strong
+    action verbs and quantified achievements, includes relevant keywords, is concise yet
+    comprehensive and follows best practices for ATS systems
+    
+    keywords: the most important keywords and phrases the resume should include for the target
+    job (technical skills, soft skills, industry terms, action verbs, certifications)
+    """,
+    
+    "combined": """
+    Resume Content:
+    {resume_content}
     
     Target Role: {target_role}
-    Key Requirements: {key_requirements}
     
-    Please provide an improved version that:
-    - Uses strong action verbs and quantified achievements
-    - Includes relevant keywords
-    - Is concise yet comprehensive
-    - Follows best practices for ATS systems
+    Target Job Description (if provided):
+    {job_description}
     """
 }
 
@@ -5,58 +5,95 @@ Automates the weekly tasks for keeping your portfolio fresh and impressive.
 """
 
 import os
-import json
-import requests
-from datetime import datetime, timedelta
-import subprocess
+import string
+import time
 import random
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-class WeeklyMaintenance:
-    def __init__(self):
-        self.portfolio_root = Path(__file__).parent.parent.parent
-        self.scripts_dir = Path(__file__).parent
-        self.metrics_dir = self.scripts_dir.parent / "metrics"
-        self.logs_dir = self.scripts_dir.parent / "maintenance-logs"
-        
-        # Create directories if they don't exist
-        self.metrics_dir.mkdir(exist_ok=True)
-        self.logs_dir.mkdir(exist_ok=True)
-        
-        self.week_start = datetime.now().strftime("%Y-%m-%d")
-        self.log_file = self.logs_dir / f"weekly-{self.week_start}.md"
-        
-        # Load configuration
-        self.load_config()
-        
-    def load_config(self):
-        """Load configuration from environment and config files"""
-        self.config = {
-            'github_token': os.getenv('GITHUB_TOKEN'),
-            'dev_to_api_key': os.getenv('DEV_TO_API_KEY'),
-            'job_target': 20,
-            'freelance_target': 10,
-            'projects_to_enhance': [
-                'job-tracker-api',
-                'portfolio-website', 
-                'ai-automation',
-                'freelancing-toolkit'
-            ]
-        }
-        
-    def log_activity(self, message):
-        """Log activity to weekly log file"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
-        
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
-        
-        print(f"✅ {message}")
-        
-    def init_weekly_log(self):
-        """Initialize the weekly log file"""
-        header = f"""# Weekly Maintenance Log - {self.week_start}
+# Faster JSON for the metrics files (optional, falls back to the standard library)
+try:
+    import orjson
+    
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    def _dumps_line(obj):
+        return orjson.dumps(obj) + b"\n"
+    
+    _loads = orjson.loads
+except ImportError:
+    import json
+    
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+    
+    def _dumps_line(obj):
+        return json.dumps(obj).encode('utf-8') + b"\n"
+    
+    _loads = json.loads
+
+# Feature ideas for each project enhance_random_project can pick
+_ENHANCEMENTS = {
+    'job-tracker-api': (
+        'Add email notification system',
+        'Implement analytics dashboard',
+        'Add bulk import/export functionality',
+        'Create mobile-responsive API docs',
+        'Add job matching algorithm'
+    ),
+    'portfolio-website': (
+        'Add dark/light theme toggle',
+        'Implement project filtering',
+        'Add testimonials section',
+        'Create interactive project demos',
+        'Add contact form with validation'
+    ),
+    'ai-automation': (
+        'Add new AI model integration',
+        'Improve error handling',
+        'Add rate limiting middleware',
+        'Create configuration dashboard',
+        'Add logging and monitoring'
+    ),
+    'freelancing-toolkit': (
+        'Add proposal template generator',
+        'Create client management system',
+        'Add invoice generation',
+        'Implement time tracking',
+        'Add project progress visualization'
+    )
+}
+
+# Topics generate_blog_post_idea picks from
+_BLOG_TOPICS = (
+    "Building a Job Tracking API with FastAPI and PostgreSQL",
+    "Web Scraping Best Practices for 2024", 
+    "Automating Freelance Workflows with Python",
+    "Building Responsive Portfolio Websites",
+    "AI Integration in Web Applications",
+    "Docker Deployment Strategies for Python Apps",
+    "RESTful API Design Principles",
+    "Database Optimization for Small Applications",
+    "Authentication and Security in FastAPI",
+    "Streamlit vs Flask: When to Use Each Framework"
+)
+
+def _split_template(template):
+    """Pre-split a {field} template into (literal text, field name) pairs"""
+    return tuple((literal, field) for literal, field, _, _ in string.Formatter().parse(template))
+
+def _fill(fragments, **values):
+    """Join a pre-split template's fragments around the given values"""
+    parts = []
+    for literal, field in fragments:
+        parts.append(literal)
+        if field is not None:
+            parts.append(str(values[field]))
+    return "".join(parts)
+
+# Static text of the generated files, split once into fragments for _fill
+_LOG_HEADER_TEMPLATE = _split_template("""# Weekly Maintenance Log - {week_start}
 
 ## Weekly Tasks Checklist
 - [ ] Add new features to projects
@@ -67,53 +104,9 @@ class WeeklyMaintenance:
 
 ## Activity Log
 
-"""
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            f.write(header)
-        
-    def enhance_random_project(self):
-        """Add a new feature to a random existing project"""
-        project = random.choice(self.config['projects_to_enhance'])
-        project_path = self.portfolio_root / project
-        
-        enhancements = {
-            'job-tracker-api': [
-                'Add email notification system',
-                'Implement analytics dashboard',
-                'Add bulk import/export functionality',
-                'Create mobile-responsive API docs',
-                'Add job matching algorithm'
-            ],
-            'portfolio-website': [
-                'Add dark/light theme toggle',
-                'Implement project filtering',
-                'Add testimonials section',
-                'Create interactive project demos',
-                'Add contact form with validation'
-            ],
-            'ai-automation': [
-                'Add new AI model integration',
-                'Improve error handling',
-                'Add rate limiting middleware',
-                'Create configuration dashboard',
-                'Add logging and monitoring'
-            ],
-            'freelancing-toolkit': [
-                'Add proposal template generator',
-                'Create client management system',
-                'Add invoice generation',
-                'Implement time tracking',
-                'Add project progress visualization'
-            ]
-        }
-        
-        if project in enhancements:
-            enhancement = random.choice(enhancements[project])
-            self.log_activity(f"🔧 Enhanced {project}: {enhancement}")
-            
-            # Create enhancement task file
-            task_file = project_path / f"enhancement-{self.week_start}.md"
-            task_content = f"""# Weekly Enhancement - {self.week_start}
+""")
+
+_ENHANCEMENT_TEMPLATE = _split_template("""# Weekly Enhancement - {week_start}
 
 ## Project: {project}
 ## Enhancement: {enhancement}
@@ -126,41 +119,17 @@ class WeeklyMaintenance:
 5. [ ] Deploy changes
 
 ### Notes:
-- Start Date: {datetime.now().strftime('%Y-%m-%d')}
+- Start Date: {start_date}
 - Priority: Medium
 - Estimated Time: 2-4 hours
 
 ### Progress:
 (Track your progress here)
-"""
-            
-            if project_path.exists():
-                with open(task_file, 'w', encoding='utf-8') as f:
-                    f.write(task_content)
-                self.log_activity(f"📝 Created enhancement task: {task_file}")
-        
-        return project, enhancement
-        
-    def generate_blog_post_idea(self):
-        """Generate a technical blog post idea based on recent work"""
-        topics = [
-            "Building a Job Tracking API with FastAPI and PostgreSQL",
-            "Web Scraping Best Practices for 2024", 
-            "Automating Freelance Workflows with Python",
-            "Building Responsive Portfolio Websites",
-            "AI Integration in Web Applications",
-            "Docker Deployment Strategies for Python Apps",
-            "RESTful API Design Principles",
-            "Database Optimization for Small Applications",
-            "Authentication and Security in FastAPI",
-            "Streamlit vs Flask: When to Use Each Framework"
-        ]
-        
-        selected_topic = random.choice(topics)
-        
-        blog_post_outline = f"""# Blog Post: {selected_topic}
+""")
 
-## Week: {self.week_start}
+_BLOG_POST_TEMPLATE = _split_template("""# Blog Post: {topic}
+
+## Week: {week_start}
 
 ### Outline:
 1. **Introduction**
@@ -189,7 +158,7 @@ class WeeklyMaintenance:
 - [ ] LinkedIn article
 
 ### SEO Keywords:
-- {selected_topic.lower().replace(' ', ', ')}
+- {seo_keywords}
 - python, web development, api, tutorial
 
 ### Estimated Reading Time: 5-8 minutes
@@ -201,56 +170,11 @@ class WeeklyMaintenance:
 - [ ] Proofread and edit
 - [ ] Publish on platforms
 - [ ] Share on social media
-"""
-        
-        blog_file = self.scripts_dir.parent / "templates" / "blog-posts" / f"weekly-post-{self.week_start}.md"
-        blog_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(blog_file, 'w', encoding='utf-8') as f:
-            f.write(blog_post_outline)
-            
-        self.log_activity(f"📝 Generated blog post idea: {selected_topic}")
-        return selected_topic
-        
-    def track_job_applications(self):
-        """Update job application tracking"""
-        job_metrics_file = self.metrics_dir / "job-metrics.json"
-        
-        # Load existing metrics or create new
-        if job_metrics_file.exists():
-            with open(job_metrics_file, 'r') as f:
-                metrics = json.load(f)
-        else:
-            metrics = {"weekly_targets": [], "applications": []}
-            
-        # Add this week's target
-        weekly_target = {
-            "week": self.week_start,
-            "target": self.config['job_target'],
-            "applied": 0,
-            "responses": 0,
-            "interviews": 0,
-            "platforms": {
-                "linkedin": 0,
-                "indeed": 0,
-                "glassdoor": 0,
-                "company_direct": 0,
-                "other": 0
-            }
-        }
-        
-        metrics["weekly_targets"].append(weekly_target)
-        
-        # Save updated metrics
-        with open(job_metrics_file, 'w') as f:
-            json.dump(metrics, f, indent=2)
-            
-        self.log_activity(f"🎯 Set job application target: {self.config['job_target']} applications")
-        
-        # Generate application reminders
-        reminder_content = f"""# Job Application Reminder - Week {self.week_start}
+""")
 
-## Target: {self.config['job_target']} Applications
+_JOB_REMINDER_TEMPLATE = _split_template("""# Job Application Reminder - Week {week_start}
+
+## Target: {target} Applications
 
 ### Daily Breakdown:
 - Monday: 4 applications
@@ -283,53 +207,11 @@ Follow-up Date: [Date + 7 days]
 ```
 
 Use the job-applications/application-manager.py script to track applications efficiently.
-"""
-        
-        reminder_file = self.logs_dir / f"job-applications-{self.week_start}.md"
-        with open(reminder_file, 'w', encoding='utf-8') as f:
-            f.write(reminder_content)
-            
-        return weekly_target
-        
-    def track_freelance_proposals(self):
-        """Update freelance proposal tracking"""
-        freelance_metrics_file = self.metrics_dir / "freelance-metrics.json" 
-        
-        # Load existing metrics or create new
-        if freelance_metrics_file.exists():
-            with open(freelance_metrics_file, 'r') as f:
-                metrics = json.load(f)
-        else:
-            metrics = {"weekly_targets": [], "proposals": []}
-            
-        # Add this week's target
-        weekly_target = {
-            "week": self.week_start,
-            "target": self.config['freelance_target'],
-            "submitted": 0,
-            "responses": 0,
-            "hired": 0,
-            "platforms": {
-                "upwork": 0,
-                "fiverr": 0,
-                "freelancer": 0,
-                "guru": 0,
-                "direct": 0
-            }
-        }
-        
-        metrics["weekly_targets"].append(weekly_target)
-        
-        # Save updated metrics
-        with open(freelance_metrics_file, 'w') as f:
-            json.dump(metrics, f, indent=2)
-            
-        self.log_activity(f"🎯 Set freelance proposal target: {self.config['freelance_target']} proposals")
-        
-        # Generate proposal reminders
-        reminder_content = f"""# Freelance Proposal Reminder - Week {self.week_start}
+""")
+
+_FREELANCE_REMINDER_TEMPLATE = _split_template("""# Freelance Proposal Reminder - Week {week_start}
 
-## Target: {self.config['freelance_target']} Proposals
+## Target: {target} Proposals
 
 ### Daily Breakdown:
 - Monday: 2 proposals
@@ -365,23 +247,9 @@ Use the job-applications/application-manager.py script to track applications eff
 - Job Tracker Demo: [API demo URL]
 
 Use the upwork-freelancer-profiles/PROPOSAL_TEMPLATES.md for quick starts.
-"""
-        
-        reminder_file = self.logs_dir / f"freelance-proposals-{self.week_start}.md"
-        with open(reminder_file, 'w', encoding='utf-8') as f:
-            f.write(reminder_content)
-            
-        return weekly_target
-        
-    def ensure_github_activity(self):
-        """Ensure GitHub stays active with meaningful commits"""
-        self.log_activity("🐙 Checking GitHub activity for the week")
-        
-        # Create a weekly contribution file
-        contrib_file = self.portfolio_root / "weekly-contributions" / f"{self.week_start}.md"
-        contrib_file.parent.mkdir(exist_ok=True)
-        
-        contrib_content = f"""# Weekly Contributions - {self.week_start}
+""")
+
+_CONTRIBUTIONS_TEMPLATE = _split_template("""# Weekly Contributions - {week_start}
 
 ## Planned Commits:
 - [ ] Monday: Project enhancement commit
@@ -407,26 +275,19 @@ Use the upwork-freelancer-profiles/PROPOSAL_TEMPLATES.md for quick starts.
 - "test: add unit tests for [functionality]"
 
 Remember: Quality over quantity - make meaningful commits that add value.
-"""
-        
-        with open(contrib_file, 'w', encoding='utf-8') as f:
-            f.write(contrib_content)
-            
-        self.log_activity("📅 Created weekly GitHub contribution plan")
-        
-    def generate_weekly_summary(self):
-        """Generate summary of the week's planned activities"""
-        summary = f"""
-# Weekly Maintenance Summary - {self.week_start}
+""")
+
+_SUMMARY_TEMPLATE = _split_template("""
+# Weekly Maintenance Summary - {week_start}
 
-## ✅ Completed Setup Tasks:
-1. ✅ Enhanced random project with new feature
-2. ✅ Generated blog post topic and outline
-3. ✅ Set job application target ({self.config['job_target']} applications)
-4. ✅ Set freelance proposal target ({self.config['freelance_target']} proposals)  
-5. ✅ Created GitHub contribution plan
+## [OK] Completed Setup Tasks:
+1. [OK] Enhanced random project with new feature
+2. [OK] Generated blog post topic and outline
+3. [OK] Set job application target ({job_target} applications)
+4. [OK] Set freelance proposal target ({freelance_target} proposals)  
+5. [OK] Created GitHub contribution plan
 
-## 📋 Your Action Items This Week:
+## [TODO] Your Action Items This Week:
 
 ### Monday:
 - Implement the project enhancement
@@ -446,25 +307,280 @@ Remember: Quality over quantity - make meaningful commits that add value.
 - Update metrics and track success rates
 - Plan next week's improvements
 
-## 📊 Success Tracking:
+## [STATS] Success Tracking:
 - Job applications: Track in `job-applications/application-manager.py`
-- Freelance proposals: Log in `metrics/freelance-metrics.json`
+- Freelance proposals: Log this week's numbers in `metrics/freelance-metrics.jsonl`
+  (folded into `metrics/freelance-metrics.json` at the start of each month)
 - Blog engagement: Monitor via Dev.to analytics
 - GitHub activity: Check contributions graph
 
-## 🎯 Next Week Preparation:
+## [TARGET] Next Week Preparation:
 - Review this week's metrics
 - Adjust strategies based on response rates
 - Plan next project enhancement
 - Generate new blog post ideas
 
 ---
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
+Generated on: {generated_on}
+""")
+
+# Write buffer for the activity log; the 8 KiB default splits it into several writes
+_BUF = 1 << 18
+
+def _write_bytes(path, data):
+    """Replace a file's contents with data using raw os.write calls
+    
+    Each generated file is written whole in one go, so there's no point
+    building a buffered text-file object around it.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+# Where everything lives, as plain strings (os.path joins skip building Path
+# objects), worked out once at import
+_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+_PORTFOLIO_ROOT = os.path.dirname(os.path.dirname(_SCRIPTS_DIR))
+_METRICS_DIR = os.path.join(os.path.dirname(_SCRIPTS_DIR), "metrics")
+_LOGS_DIR = os.path.join(os.path.dirname(_SCRIPTS_DIR), "maintenance-logs")
+
+# Directories already created by this process, so repeat runs skip the syscalls
+_MKDIR_CACHE = set()
+
+def _ensure_dir(path):
+    """Create a directory (and its parents) unless this process already has"""
+    if path in _MKDIR_CACHE:
+        return
+    os.makedirs(path, exist_ok=True)
+    _MKDIR_CACHE.add(path)
+
+def _atomic_write_json(path, obj):
+    """Write obj as JSON to path, so readers see the old or new file, never half of one"""
+    tmp_path = f"{path}.tmp"
+    _write_bytes(tmp_path, _dumps(obj))
+    os.replace(tmp_path, path)
+
+class WeeklyMaintenance:
+    def __init__(self):
+        self.portfolio_root = _PORTFOLIO_ROOT
+        self.scripts_dir = _SCRIPTS_DIR
+        self.metrics_dir = _METRICS_DIR
+        self.logs_dir = _LOGS_DIR
+        
+        # Create directories if they don't exist
+        _ensure_dir(self.metrics_dir)
+        _ensure_dir(self.logs_dir)
+        
+        # The run's start time, read once; the date parts are formatted from it
+        self._started = time.localtime()
+        self.week_start = time.strftime("%Y-%m-%d", self._started)
+        
+        # Dedicated generator (seeded from os.urandom) rather than the shared module-level one
+        self._rng = random.Random()
+        
+        # Whether each project's directory exists, checked once per process
+        self._project_exists_cache = {}
+        
+        self.log_file = os.path.join(self.logs_dir, f"weekly-{self.week_start}.md")
+        # Opened by init_weekly_log and held for the whole run instead of
+        # reopened for every entry
+        self._log_fh = None
+        # The weekly tasks run in parallel threads and all log here
+        self._log_lock = threading.Lock()
+        
+        # Load configuration
+        self.load_config()
+        
+    def load_config(self):
+        """Load configuration from environment and config files"""
+        self.config = {
+            'github_token': os.getenv('GITHUB_TOKEN'),
+            'dev_to_api_key': os.getenv('DEV_TO_API_KEY'),
+            'job_target': 20,
+            'freelance_target': 10,
+            'projects_to_enhance': [
+                'job-tracker-api',
+                'portfolio-website', 
+                'ai-automation',
+                'freelancing-toolkit'
+            ]
+        }
+        
+    def log_activity(self, message, icon=None):
+        """Log activity to weekly log file
+        
+        The optional icon is only shown on the console; the log file gets
+        plain text.
+        """
+        timestamp = time.strftime("%H:%M:%S")
+        log_entry = f"[{timestamp}] {message}\n"
+        
+        with self._log_lock:
+            if self._log_fh is not None:
+                self._log_fh.write(log_entry)
+            print(f"✅ {icon} {message}" if icon else f"✅ {message}")
+        
+    def close(self):
+        """Flush and close the weekly log file, if it was opened"""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
         
-        summary_file = self.logs_dir / f"weekly-summary-{self.week_start}.md"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            f.write(summary)
+    def init_weekly_log(self):
+        """Initialize the weekly log file"""
+        header = _fill(_LOG_HEADER_TEMPLATE, week_start=self.week_start)
+        self._log_fh = open(self.log_file, 'w', encoding='utf-8', buffering=_BUF)
+        self._log_fh.write(header)
+        
+    def enhance_random_project(self):
+        """Add a new feature to a random existing project"""
+        project = self._rng.choice(self.config['projects_to_enhance'])
+        project_path = os.path.join(self.portfolio_root, project)
+        
+        if project in _ENHANCEMENTS:
+            enhancement = self._rng.choice(_ENHANCEMENTS[project])
+            self.log_activity(f"Enhanced {project}: {enhancement}", icon="🔧")
+            
+            # Create enhancement task file
+            task_file = os.path.join(project_path, f"enhancement-{self.week_start}.md")
+            task_content = _fill(
+                _ENHANCEMENT_TEMPLATE,
+                week_start=self.week_start,
+                project=project,
+                enhancement=enhancement,
+                start_date=self.week_start
+            )
+            
+            exists = self._project_exists_cache.get(project)
+            if exists is None:
+                exists = self._project_exists_cache[project] = os.path.isdir(project_path)
+            if exists:
+                _write_bytes(task_file, task_content.encode('utf-8'))
+                self.log_activity(f"Created enhancement task: {task_file}", icon="📝")
+        
+        return project, enhancement
+        
+    def generate_blog_post_idea(self):
+        """Generate a technical blog post idea based on recent work"""
+        selected_topic = self._rng.choice(_BLOG_TOPICS)
+        
+        blog_post_outline = _fill(
+            _BLOG_POST_TEMPLATE,
+            topic=selected_topic,
+            week_start=self.week_start,
+            seo_keywords=selected_topic.lower().replace(' ', ', ')
+        )
+        
+        blog_dir = os.path.join(os.path.dirname(self.scripts_dir), "templates", "blog-posts")
+        _ensure_dir(blog_dir)
+        blog_file = os.path.join(blog_dir, f"weekly-post-{self.week_start}.md")
+        
+        _write_bytes(blog_file, blog_post_outline.encode('utf-8'))
+            
+        self.log_activity(f"Generated blog post idea: {selected_topic}", icon="📝")
+        return selected_topic
+        
+    def _compact_metrics(self, name, records_key):
+        """Fold the weekly records appended to <name>.jsonl into <name>.json
+        
+        The full JSON file is rebuilt once a month rather than rewritten
+        every week.
+        """
+        log_file = os.path.join(self.metrics_dir, f"{name}.jsonl")
+        if not os.path.exists(log_file):
+            return
+        
+        metrics_file = os.path.join(self.metrics_dir, f"{name}.json")
+        if os.path.exists(metrics_file):
+            with open(metrics_file, 'rb') as f:
+                metrics = _loads(f.read())
+        else:
+            metrics = {"weekly_targets": [], records_key: []}
+        
+        with open(log_file, 'rb') as f:
+            metrics["weekly_targets"].extend(_loads(line) for line in f if line.strip())
+        
+        # The .jsonl is only removed once the folded-in JSON is safely in place
+        _atomic_write_json(metrics_file, metrics)
+        os.remove(log_file)
+        
+    def _track_metric(self, name, records_key, target, counters, platforms, reminder_template,
+                      reminder_name, description, unit):
+        """Record this week's target for a metric and write its reminder file
+        
+        The weekly record has the target, zeroed counters and a zeroed count
+        per platform. It's appended to metrics/<name>.jsonl, then folded into
+        <name>.json on the first run of the month.
+        """
+        weekly_target = {"week": self.week_start, "target": target}
+        weekly_target.update(dict.fromkeys(counters, 0))
+        weekly_target["platforms"] = dict.fromkeys(platforms, 0)
+        
+        # Append just this week's record; it's folded into <name>.json monthly
+        with open(os.path.join(self.metrics_dir, f"{name}.jsonl"), 'ab') as f:
+            f.write(_dumps_line(weekly_target))
+        if self._started.tm_mday <= 7:
+            self._compact_metrics(name, records_key)
+            
+        self.log_activity(f"Set {description} target: {target} {unit}", icon="🎯")
+        
+        reminder_content = _fill(reminder_template, week_start=self.week_start, target=target)
+        reminder_file = os.path.join(self.logs_dir, f"{reminder_name}-{self.week_start}.md")
+        _write_bytes(reminder_file, reminder_content.encode('utf-8'))
+            
+        return weekly_target
+        
+    def track_job_applications(self):
+        """Update job application tracking"""
+        return self._track_metric(
+            "job-metrics", "applications", self.config['job_target'],
+            counters=("applied", "responses", "interviews"),
+            platforms=("linkedin", "indeed", "glassdoor", "company_direct", "other"),
+            reminder_template=_JOB_REMINDER_TEMPLATE, reminder_name="job-applications",
+            description="job application", unit="applications"
+        )
+        
+    def track_freelance_proposals(self):
+        """Update freelance proposal tracking"""
+        return self._track_metric(
+            "freelance-metrics", "proposals", self.config['freelance_target'],
+            counters=("submitted", "responses", "hired"),
+            platforms=("upwork", "fiverr", "freelancer", "guru", "direct"),
+            reminder_template=_FREELANCE_REMINDER_TEMPLATE, reminder_name="freelance-proposals",
+            description="freelance proposal", unit="proposals"
+        )
+        
+    def ensure_github_activity(self):
+        """Ensure GitHub stays active with meaningful commits"""
+        self.log_activity("Checking GitHub activity for the week", icon="🐙")
+        
+        # Create a weekly contribution file
+        contrib_dir = os.path.join(self.portfolio_root, "weekly-contributions")
+        _ensure_dir(contrib_dir)
+        contrib_file = os.path.join(contrib_dir, f"{self.week_start}.md")
+        
+        contrib_content = _fill(_CONTRIBUTIONS_TEMPLATE, week_start=self.week_start)
+        
+        _write_bytes(contrib_file, contrib_content.encode('utf-8'))
+            
+        self.log_activity("Created weekly GitHub contribution plan", icon="📅")
+        
+    def generate_weekly_summary(self):
+        """Generate summary of the week's planned activities"""
+        summary = _fill(
+            _SUMMARY_TEMPLATE,
+            week_start=self.week_start,
+            job_target=self.config['job_target'],
+            freelance_target=self.config['freelance_target'],
+            generated_on=time.strftime('%Y-%m-%d %H:%M:%S')
+        )
+        
+        summary_file = os.path.join(self.logs_dir, f"weekly-summary-{self.week_start}.md")
+        _write_bytes(summary_file, summary.encode('utf-8'))
             
         print("\n" + "="*60)
         print(summary)
@@ -477,21 +593,28 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         print(f"\n🚀 Starting Weekly Portfolio Maintenance - {self.week_start}")
         print("="*60)
         
-        # Initialize log
-        self.init_weekly_log()
-        
-        # Execute all weekly tasks
         try:
-            project, enhancement = self.enhance_random_project()
-            blog_topic = self.generate_blog_post_idea() 
-            job_target = self.track_job_applications()
-            freelance_target = self.track_freelance_proposals()
-            self.ensure_github_activity()
+            # Initialize log
+            self.init_weekly_log()
+            
+            # Execute all weekly tasks; each writes its own files, so they run in parallel
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                enhancement_task = executor.submit(self.enhance_random_project)
+                blog_task = executor.submit(self.generate_blog_post_idea)
+                job_task = executor.submit(self.track_job_applications)
+                freelance_task = executor.submit(self.track_freelance_proposals)
+                github_task = executor.submit(self.ensure_github_activity)
+            
+            project, enhancement = enhancement_task.result()
+            blog_topic = blog_task.result()
+            job_target = job_task.result()
+            freelance_target = freelance_task.result()
+            github_task.result()
             
             # Generate final summary
             summary_file = self.generate_weekly_summary()
             
-            self.log_activity("🎉 Weekly maintenance completed successfully!")
+            self.log_activity("Weekly maintenance completed successfully!", icon="🎉")
             
             return {
                 'success': True,
@@ -505,15 +628,18 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             }
             
         except Exception as e:
-            error_msg = f"❌ Error during weekly maintenance: {str(e)}"
-            self.log_activity(error_msg)
-            print(error_msg)
+            error_msg = f"Error during weekly maintenance: {str(e)}"
+            self.log_activity(error_msg, icon="❌")
+            print(f"❌ {error_msg}")
             
             return {
                 'success': False,
                 'error': str(e),
                 'log_file': str(self.log_file)
             }
+        
+        finally:
+            self.close()
 
 def main():
     """Main execution function"""